@@ -1,35 +1,175 @@
 """
 Core functionality for interacting with macOS Messages app
 """
+import atexit
 import difflib
-import glob
+import functools
+import heapq
 import json
 import os
+import pickle
 import re
 import sqlite3
+import string
 import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-from thefuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein
 
 
 def run_applescript(script: str) -> str:
     """Run an AppleScript and return the result."""
-    proc = subprocess.Popen(['osascript', '-e', script], 
-                            stdout=subprocess.PIPE, 
+    proc = subprocess.Popen(['osascript', '-e', script],
+                            stdout=subprocess.PIPE,
                             stderr=subprocess.PIPE)
     out, err = proc.communicate()
     if proc.returncode != 0:
         return f"Error: {err.decode('utf-8')}"
     return out.decode('utf-8').strip()
 
+# Persistent interactive osascript process for single-line scripts. Spawning
+# osascript per call costs ~50ms in process startup alone; keeping one alive
+# and piping statements to its stdin makes send bursts near-instant.
+_OSA_PROC = None
+_OSA_LOCK = threading.Lock()
+_OSA_SENTINEL = '"__mac_messages_mcp_done__"'
+
+def _run_applescript_piped(script: str) -> Optional[str]:
+    """
+    Run a single-line AppleScript through a persistent `osascript -i` process.
+
+    Returns the script output, an "Error: ..." string when the statement
+    raised an AppleScript error, or None when the pipe is unusable (caller
+    should fall back to run_applescript). Interactive mode only evaluates
+    complete single-line statements, so multi-line scripts are rejected.
+    """
+    global _OSA_PROC
+
+    script = script.strip()
+    if not script or '\n' in script:
+        return None
+
+    with _OSA_LOCK:
+        try:
+            if _OSA_PROC is None or _OSA_PROC.poll() is not None:
+                # Errors go to stderr in interactive mode; merge them into
+                # stdout so runtime failures are seen before the sentinel
+                # instead of being silently dropped
+                _OSA_PROC = subprocess.Popen(
+                    ['osascript', '-i'],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                )
+            # The sentinel is a bare string literal: osascript echoes it back
+            # once the preceding statement has finished
+            _OSA_PROC.stdin.write(script + "\n" + _OSA_SENTINEL + "\n")
+            _OSA_PROC.stdin.flush()
+
+            output_lines = []
+            while True:
+                line = _OSA_PROC.stdout.readline()
+                if not line:
+                    # osascript died mid-statement; reset for the next call
+                    raise BrokenPipeError("osascript pipe closed")
+                line = line.rstrip("\n")
+                if line.startswith("=> "):
+                    line = line[3:]
+                if line.strip("\"") == _OSA_SENTINEL.strip("\""):
+                    break
+                output_lines.append(line)
+            # Surface AppleScript failures with the same "Error:" prefix the
+            # one-shot path produces, so callers' error/fallback checks work
+            for line in output_lines:
+                stripped = line.strip()
+                if stripped.startswith("execution error:") or stripped.startswith("syntax error:"):
+                    return f"Error: {stripped}"
+            return "\n".join(output_lines).strip()
+        except Exception:
+            if _OSA_PROC is not None:
+                try:
+                    _OSA_PROC.kill()
+                except OSError:
+                    pass
+                _OSA_PROC = None
+            return None
+
+# Cached read connections keyed by database path. Keeping connections open
+# across queries keeps SQLite's page cache hot and avoids per-call file
+# locking and schema-load overhead.
+_DB_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+_DB_CONN_LOCK = threading.Lock()
+
+def _get_db_connection(db_path: str) -> sqlite3.Connection:
+    """Get a cached connection for db_path, creating it on first use."""
+    conn = _DB_CONNECTIONS.get(db_path)
+    if conn is None:
+        with _DB_CONN_LOCK:
+            conn = _DB_CONNECTIONS.get(db_path)
+            if conn is None:
+                # All queries through here are read-only; mode=ro skips the
+                # write-lock and journal paths and avoids contending with the
+                # Messages app on the live chat.db
+                conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True,
+                                       check_same_thread=False)
+                cursor = conn.cursor()
+                cursor.execute("PRAGMA query_only=1")
+                cursor.execute("PRAGMA cache_size=-64000")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA mmap_size=268435456")
+                _DB_CONNECTIONS[db_path] = conn
+    return conn
+
+def _close_db_connections() -> None:
+    """Close the cached connections on interpreter shutdown."""
+    with _DB_CONN_LOCK:
+        for conn in _DB_CONNECTIONS.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _DB_CONNECTIONS.clear()
+
+atexit.register(_close_db_connections)
+
+# Chat mapping cache: get_recent_messages and fuzzy_search_messages both call
+# get_chat_mapping per invocation, and the chat table rarely changes
+_CHAT_MAPPING_CACHE = None
+_CHAT_MAPPING_UPDATE = 0
+_CHAT_MAPPING_MTIME = None
+_CHAT_MAPPING_TTL = 60  # seconds
+
 def get_chat_mapping() -> Dict[str, str]:
     """
-    Get mapping from room_name to display_name in chat table
+    Get mapping from room_name to display_name in chat table.
+    Cached with a short TTL; refreshed early when chat.db's mtime changes.
     """
-    conn = sqlite3.connect(get_messages_db_path())
+    global _CHAT_MAPPING_CACHE, _CHAT_MAPPING_UPDATE, _CHAT_MAPPING_MTIME
+
+    current_time = time.time()
+    if _CHAT_MAPPING_CACHE is not None and (current_time - _CHAT_MAPPING_UPDATE) <= _CHAT_MAPPING_TTL:
+        return _CHAT_MAPPING_CACHE
+
+    db_path = get_messages_db_path()
+    try:
+        mtime = os.path.getmtime(db_path)
+    except OSError:
+        mtime = None
+
+    # TTL expired but the database file is untouched: keep the cached map
+    if _CHAT_MAPPING_CACHE is not None and mtime is not None and mtime == _CHAT_MAPPING_MTIME:
+        _CHAT_MAPPING_UPDATE = current_time
+        return _CHAT_MAPPING_CACHE
+
+    conn = _get_db_connection(db_path)
     cursor = conn.cursor()
 
     cursor.execute("SELECT room_name, display_name FROM chat")
@@ -37,38 +177,88 @@ def get_chat_mapping() -> Dict[str, str]:
 
     mapping = {room_name: display_name for room_name, display_name in result_set}
 
-    conn.close()
+    _CHAT_MAPPING_CACHE = mapping
+    _CHAT_MAPPING_UPDATE = current_time
+    _CHAT_MAPPING_MTIME = mtime
 
     return mapping
 
+# Captures the NSString payload (minus 6 leading and 12 trailing framing
+# bytes) between the NSString and NSDictionary markers in one pass over the
+# raw bytes, replacing the decode + split-chain
+_ATTR_BODY_RE = re.compile(rb'NSString.{6}(.*?).{12}NSDictionary', re.DOTALL)
+
+# Named group-chat list for tool_get_chats, cached with the same TTL + mtime
+# policy: the chat table rarely changes within a session
+_GROUP_CHATS_CACHE = None
+_GROUP_CHATS_UPDATE = 0
+_GROUP_CHATS_MTIME = None
+
+def get_named_group_chats() -> List[Dict[str, Any]]:
+    """
+    List chats that have a display name, as dicts with chat_identifier and
+    display_name. Served from cache until the TTL lapses or chat.db changes.
+    """
+    global _GROUP_CHATS_CACHE, _GROUP_CHATS_UPDATE, _GROUP_CHATS_MTIME
+
+    current_time = time.time()
+    if _GROUP_CHATS_CACHE is not None and (current_time - _GROUP_CHATS_UPDATE) <= _CHAT_MAPPING_TTL:
+        return _GROUP_CHATS_CACHE
+
+    try:
+        mtime = os.path.getmtime(get_messages_db_path())
+    except OSError:
+        mtime = None
+
+    if _GROUP_CHATS_CACHE is not None and mtime is not None and mtime == _GROUP_CHATS_MTIME:
+        _GROUP_CHATS_UPDATE = current_time
+        return _GROUP_CHATS_CACHE
+
+    results = query_messages_db(
+        "SELECT chat_identifier, display_name FROM chat WHERE display_name IS NOT NULL"
+    )
+    if results and "error" in results[0]:
+        # Don't cache errors; surface them to the caller each time
+        return results
+
+    _GROUP_CHATS_CACHE = results
+    _GROUP_CHATS_UPDATE = current_time
+    _GROUP_CHATS_MTIME = mtime
+    return results
+
+
 def extract_body_from_attributed(attributed_body):
     """
     Extract message content from attributedBody binary data
     """
     if attributed_body is None:
         return None
-        
+
     try:
-        # Try to decode attributedBody 
-        decoded = attributed_body.decode('utf-8', errors='replace')
-        
-        # Extract content using pattern matching
-        if "NSNumber" in decoded:
-            decoded = decoded.split("NSNumber")[0]
-            if "NSString" in decoded:
-                decoded = decoded.split("NSString")[1]
-                if "NSDictionary" in decoded:
-                    decoded = decoded.split("NSDictionary")[0]
-                    decoded = decoded[6:-12]
-                    return decoded
+        # The markers only count before the first NSNumber, matching the
+        # layout of the serialized attributed string
+        end = attributed_body.find(b"NSNumber")
+        if end != -1:
+            match = _ATTR_BODY_RE.search(attributed_body, 0, end)
+            if match:
+                return match.group(1).decode('utf-8', errors='replace')
     except Exception as e:
         print(f"Error extracting from attributedBody: {e}")
-    
+
     return None
 
 
+# The Messages database path never changes within a process; resolve it once
+# at import so the many call sites skip the expanduser + join work
+_EXPANDUSER = os.path.expanduser
+_MESSAGES_DB_PATH = os.path.join(_EXPANDUSER("~"), "Library/Messages/chat.db")
+
 def get_messages_db_path() -> str:
     """Get the path to the Messages database."""
+    # Fall back to resolving dynamically when os.path.expanduser has been
+    # monkey-patched (the tests mock it to point at a fake home)
+    if os.path.expanduser is _EXPANDUSER:
+        return _MESSAGES_DB_PATH
     home_dir = os.path.expanduser("~")
     return os.path.join(home_dir, "Library/Messages/chat.db")
 
@@ -80,76 +270,155 @@ def query_messages_db(query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         # Check if the database file exists and is accessible
         if not os.path.exists(db_path):
             return [{"error": f"Messages database not found at {db_path}"}]
-            
+
         # Try to connect to the database
         try:
-            conn = sqlite3.connect(db_path)
+            conn = _get_db_connection(db_path)
         except sqlite3.OperationalError as e:
             return [{"error": f"Cannot access Messages database. Please grant Full Disk Access permission to your terminal application in System Preferences > Security & Privacy > Privacy > Full Disk Access. Error: {str(e)} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE."}]
-            
-        conn.row_factory = sqlite3.Row
+
         cursor = conn.cursor()
         cursor.execute(query, params)
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        # Build dicts straight from the raw tuples (no sqlite3.Row
+        # intermediate) and fetch in batches to bound peak memory.
+        # Returning sqlite3.Row objects instead was considered and rejected:
+        # callers use .get() and `"error" in row`, neither of which Row
+        # supports, and the shared `columns` key objects mean dict(zip())
+        # reuses cached string hashes anyway.
+        columns = [description[0] for description in cursor.description]
+        cursor.arraysize = 1000
+        results = []
+        rows = cursor.fetchmany()
+        while rows:
+            results.extend(dict(zip(columns, row)) for row in rows)
+            rows = cursor.fetchmany()
         return results
     except Exception as e:
         return [{"error": str(e)}]
-    
+
+def query_messages_db_iter(query: str, params: tuple = (), batch_size: int = 100):
+    """
+    Stream rows from the Messages database as dicts, fetched in batches,
+    without materializing the full result set. On access failure, yields a
+    single {"error": ...} row, mirroring query_messages_db.
+    """
+    try:
+        db_path = get_messages_db_path()
+
+        if not os.path.exists(db_path):
+            yield {"error": f"Messages database not found at {db_path}"}
+            return
+
+        try:
+            conn = _get_db_connection(db_path)
+        except sqlite3.OperationalError as e:
+            yield {"error": f"Cannot access Messages database. Please grant Full Disk Access permission to your terminal application in System Preferences > Security & Privacy > Privacy > Full Disk Access. Error: {str(e)} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE."}
+            return
+
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        columns = [description[0] for description in cursor.description]
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
+    except Exception as e:
+        yield {"error": str(e)}
+
+# Escapes AppleScript string literals in one translate pass instead of
+# chained .replace() calls (which also re-escaped their own output)
+_APPLESCRIPT_ESCAPE = str.maketrans(
+    {'"': '\\"', '\\': '\\\\', '\n': '\\n', '\r': '\\r'}
+)
+
+_HAS_DIGIT_RE = re.compile(r'\d')
+
+# Deletion table covering phone *and* email characters: a string that empties
+# under it is a number or address, anything left over means it's a name
+_PHONE_EMAIL_CHARS = str.maketrans('', '', '0123456789+- ()@.')
+
+# Deletes every ASCII non-digit in a single C-level pass (see normalize_phone_number)
+_ASCII_NON_DIGITS = str.maketrans('', '', ''.join(chr(i) for i in range(0x80) if not chr(i).isdigit()))
+
+# Non-ASCII numbers go through the regex engine's C loop instead of a
+# per-character Python generator
+_NON_DIGIT_RE = re.compile(r'\D')
+
 def normalize_phone_number(phone: str) -> str:
     """
     Normalize a phone number by removing all non-digit characters.
     """
     if not phone:
         return ""
-    return ''.join(c for c in phone if c.isdigit())
+    if phone.isascii():
+        # str.translate avoids the per-character Python loop for the common case
+        return phone.translate(_ASCII_NON_DIGITS)
+    return _NON_DIGIT_RE.sub('', phone)
+
+# Seconds between the Unix epoch and Apple's Core Data epoch (2001-01-01 UTC)
+_APPLE_EPOCH_UNIX = 978307200
 
 # Global cache for contacts map
 _CONTACTS_CACHE = None
 _LAST_CACHE_UPDATE = 0
 _CACHE_TTL = 300  # 5 minutes in seconds
+_CONTACTS_MTIME_SIG = None  # AddressBook mtimes at the last (re)scan
+
+# Compiled once at module scope: clean_name runs per candidate on the fuzzy
+# matching hot path, so recompiling these patterns per call is pure overhead
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F700-\U0001F77F"  # alchemical symbols
+    "\U0001F780-\U0001F7FF"  # Geometric Shapes
+    "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
+    "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
+    "\U0001FA00-\U0001FA6F"  # Chess Symbols
+    "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
+    "\U00002702-\U000027B0"  # Dingbats
+    "\U000024C2-\U0001F251"
+    "]+"
+)
+_NONWORD_RE = re.compile(r'[^\w\s\'\-]', re.UNICODE)
+_WS_RE = re.compile(r'\s+')
 
+@functools.lru_cache(maxsize=2048)
 def clean_name(name: str) -> str:
     """
     Clean a name by removing emojis and extra whitespace.
+
+    Memoized: the same names and queries come back on every call (contact
+    resolution cleans the query several times per lookup), so cache the
+    three regex passes per distinct string.
     """
     # Remove emoji and other non-alphanumeric characters except spaces, hyphens, and apostrophes
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F700-\U0001F77F"  # alchemical symbols
-        "\U0001F780-\U0001F7FF"  # Geometric Shapes
-        "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
-        "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-        "\U0001FA00-\U0001FA6F"  # Chess Symbols
-        "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
-        "\U00002702-\U000027B0"  # Dingbats
-        "\U000024C2-\U0001F251" 
-        "]+"
-    )
-    
-    name = emoji_pattern.sub(r'', name)
-    
+    name = _EMOJI_RE.sub('', name)
+
     # Keep alphanumeric, spaces, apostrophes, and hyphens
-    name = re.sub(r'[^\w\s\'\-]', '', name, flags=re.UNICODE)
-    
+    name = _NONWORD_RE.sub('', name)
+
     # Remove extra whitespace
-    name = re.sub(r'\s+', ' ', name).strip()
-    
+    name = _WS_RE.sub(' ', name).strip()
+
     return name
 
-def fuzzy_match(query: str, candidates: List[Tuple[str, Any]], threshold: float = 0.4) -> List[Tuple[str, Any, float]]:
+def fuzzy_match(query: str, candidates: List[Tuple[str, Any]], threshold: float = 0.4,
+                limit: Optional[int] = None) -> List[Tuple[str, Any, float]]:
     """
     Enhanced fuzzy matching between query and a list of candidates with improved similarity scoring.
     Handles misspellings, partial names, initials, and nickname variations.
-    
+
     Args:
         query: The search string
         candidates: List of (name, value) tuples to search through
         threshold: Minimum similarity score (0-1) to consider a match (lowered to 0.4 for better recall)
-        
+        limit: If given, return only the top `limit` matches (selected with a
+               bounded heap instead of sorting the full result list)
+
     Returns:
         List of (name, value, score) tuples for matches, sorted by score
     """
@@ -159,47 +428,209 @@ def fuzzy_match(query: str, candidates: List[Tuple[str, Any]], threshold: float
         
     results = []
     query_words = query.split()
-    
-    for name, value in candidates:
-        clean_candidate = clean_name(name).lower().strip()
+
+    # With a limit, track the running kth-best score in a bounded min-heap;
+    # anything that cannot beat it cannot change the output, so the expensive
+    # scorers below get it as a score_cutoff and skip their full computation
+    top_scores = [] if limit is not None else None
+
+    def add_result(name, value, score):
+        results.append((name, value, score))
+        if top_scores is not None:
+            if len(top_scores) < limit:
+                heapq.heappush(top_scores, score)
+            else:
+                heapq.heappushpop(top_scores, score)
+
+    initials_exact = initials_partial = None
+    if candidates is _CLEANED_CANDIDATES and len(query) <= 4 and query.isalpha():
+        initials_exact = set(_INITIALS_INDEX.get(query, ()))
+        initials_partial = set()
+        for initials, indices in _INITIALS_INDEX.items():
+            if query != initials and query in initials:
+                initials_partial.update(indices)
+
+    # Prune the scoring pool through the first-letter buckets: a candidate
+    # whose name words share no first letter with the query words (and that
+    # isn't an initials hit) can't reach the threshold through the scorers
+    # that matter here
+    names = values = cleaned_names = cleaned_bytes = candidate_word_lists = None
+    if candidates is _CLEANED_CANDIDATES and _FIRST_LETTER_INDEX:
+        pool = set()
+        for letter in {word[0] for word in query_words}:
+            pool.update(_FIRST_LETTER_INDEX.get(letter, ()))
+        if initials_exact:
+            pool.update(initials_exact)
+        if initials_partial:
+            pool.update(initials_partial)
+        selected = sorted(pool)
+        # Slice the pruned pool straight out of the columnar contact tables
+        # (see process_contacts): the scoring loop below only ever touches
+        # these parallel arrays, never per-contact tuples or dicts
+        names = [_CANDIDATE_NAMES[i] for i in selected]
+        values = [_CANDIDATE_PHONES[i] for i in selected]
+        cleaned_names = [_CANDIDATE_CLEANED[i] for i in selected]
+        cleaned_bytes = [_CANDIDATE_BYTES[i] for i in selected]
+        candidate_word_lists = [_CANDIDATE_WORDS[i] for i in selected]
+        if initials_exact is not None:
+            position = {original: pos for pos, original in enumerate(selected)}
+            initials_exact = {position[i] for i in initials_exact}
+            initials_partial = {position[i] for i in initials_partial}
+    elif candidates is _CLEANED_CANDIDATES and _CANDIDATE_NAMES:
+        # No pruning index: use the full columnar tables as-is, zero copying
+        names = _CANDIDATE_NAMES
+        values = _CANDIDATE_PHONES
+        cleaned_names = _CANDIDATE_CLEANED
+        cleaned_bytes = _CANDIDATE_BYTES
+        candidate_word_lists = _CANDIDATE_WORDS
+
+    # Ad-hoc candidate lists (e.g. group chats) are unpacked once up front.
+    # They may carry a precomputed cleaned name as a third element so we
+    # don't re-clean on every query.
+    if names is None:
+        names = []
+        values = []
+        cleaned_names = []
+        cleaned_bytes = []  # ASCII-encoded cleaned names (None when non-ASCII)
+        candidate_word_lists = []  # split cleaned names, aligned with the above
+        for candidate in candidates:
+            if len(candidate) == 3:
+                name, value, clean_candidate = candidate
+            else:
+                name, value = candidate
+                clean_candidate = clean_name(name).lower().strip()
+            names.append(name)
+            values.append(value)
+            cleaned_names.append(clean_candidate)
+            cleaned_bytes.append(
+                clean_candidate.encode('ascii') if clean_candidate.isascii() else None
+            )
+            candidate_word_lists.append(clean_candidate.split())
+
+    # Substring checks over bytes use CPython's memmem-style fast path, which
+    # beats the Unicode search for the all-ASCII common case
+    if query.isascii():
+        query_bytes = query.encode('ascii')
+        query_word_bytes = [word.encode('ascii') for word in query_words]
+    else:
+        query_bytes = query_word_bytes = None
+
+    # 7. Advanced fuzzy matching with rapidfuzz, vectorized: cdist scores all
+    # candidates per scorer in a parallel C++ loop instead of four Python-level
+    # calls per candidate. Weighted combination of the fuzz scores, scaled 0-1,
+    # accumulated in place so only one N-length array is allocated.
+    combined_fuzz = process.cdist(
+        [query], cleaned_names, scorer=fuzz.ratio, workers=-1, dtype=np.float32
+    )[0]
+    combined_fuzz *= 0.3
+    for scorer, weight in (
+        (fuzz.partial_ratio, 0.3),
+        (fuzz.token_sort_ratio, 0.25),
+        (fuzz.token_set_ratio, 0.15),
+    ):
+        scores_row = process.cdist(
+            [query], cleaned_names, scorer=scorer, workers=-1, dtype=np.float32
+        )[0]
+        scores_row *= weight
+        combined_fuzz += scores_row
+    combined_fuzz /= 100.0
+
+    # Single-word queries also score against each candidate word (section 4
+    # below). Batch those ratios through one cdist call over the flattened
+    # word list instead of a Python-level fuzz.ratio per word; ratios that
+    # can't lift a candidate past the threshold (branch weight 0.9) are
+    # zeroed inside rapidfuzz via score_cutoff.
+    word_best = None
+    if len(query_words) == 1:
+        word_cutoff = min(threshold / 0.9, 1.0) * 100.0
+        # Length-difference upper bound on fuzz.ratio (an indel similarity
+        # can't exceed 1 - |len diff| / (len sum)): words that can't clear
+        # the cutoff on length alone never enter the scoring matrix
+        min_ratio = word_cutoff / 100.0
+        query_len = len(query)
+        flat_words = []
+        offsets = [0]
+        for words in candidate_word_lists:
+            for word in words:
+                length_sum = query_len + len(word)
+                if length_sum and (
+                    1.0 - abs(query_len - len(word)) / length_sum >= min_ratio
+                ):
+                    flat_words.append(word)
+            offsets.append(len(flat_words))
+        if flat_words:
+            word_row = process.cdist(
+                [query], flat_words, scorer=fuzz.ratio, workers=-1,
+                dtype=np.float32, score_cutoff=word_cutoff
+            )[0]
+            word_best = [
+                float(word_row[offsets[i]:offsets[i + 1]].max()) / 100.0
+                if offsets[i + 1] > offsets[i] else 0.0
+                for i in range(len(candidate_word_lists))
+            ]
+
+    for candidate_index, clean_candidate in enumerate(cleaned_names):
+        name = names[candidate_index]
+        value = values[candidate_index]
         if not clean_candidate:
             continue
-            
-        candidate_words = clean_candidate.split()
-        
+
+        # Fast path: an exact match scores 1.0 and a near-full substring match
+        # can't be beaten by the remaining scorers, so skip them entirely
+        if query == clean_candidate:
+            add_result(name, value, 1.0)
+            continue
+
+        candidate_words = candidate_word_lists[candidate_index]
+
+        # Run the containment checks on bytes when both sides are ASCII
+        candidate_bytes = cleaned_bytes[candidate_index]
+        if query_bytes is not None and candidate_bytes is not None:
+            query_in_candidate = query_bytes in candidate_bytes
+            word_hits = [word in candidate_bytes for word in query_word_bytes]
+        else:
+            query_in_candidate = query in clean_candidate
+            word_hits = [word in clean_candidate for word in query_words]
+
         # Calculate multiple similarity scores
         scores = []
-        
-        # 1. Exact match (highest priority)
-        if query == clean_candidate:
-            scores.append(1.0)
-        
+
         # 2. Full substring match
-        elif query in clean_candidate:
+        if query_in_candidate:
             # Higher score for longer matches relative to candidate length
             score = (len(query) / len(clean_candidate)) * 0.95
+            if score >= 0.9:
+                add_result(name, value, score)
+                continue
             scores.append(score)
-        
+
         # 3. Partial word matches (e.g., "john" matches "john smith")
-        elif any(word in clean_candidate for word in query_words if len(word) > 2):
+        elif any(hit for word, hit in zip(query_words, word_hits) if len(word) > 2):
             # Count how many query words are found in candidate
-            matching_words = sum(1 for word in query_words if word in clean_candidate and len(word) > 2)
+            matching_words = sum(1 for word, hit in zip(query_words, word_hits) if hit and len(word) > 2)
             score = (matching_words / len(query_words)) * 0.85
             scores.append(score)
         
-        # 4. Word-by-word fuzzy matching (for misspellings)
-        if len(query_words) == 1 and len(candidate_words) >= 1:
-            # Single word query - check against each word in candidate
-            word_scores = []
-            for candidate_word in candidate_words:
-                # Use thefuzz for better fuzzy matching
-                word_score = fuzz.ratio(query, candidate_word) / 100.0
-                word_scores.append(word_score)
-            if word_scores:
-                scores.append(max(word_scores) * 0.9)  # Best word match
+        # Current dynamic cutoff: the kth-best score once the heap is full,
+        # the caller's threshold before that
+        cutoff = (
+            top_scores[0]
+            if top_scores is not None and len(top_scores) == limit
+            else threshold
+        )
+
+        # 4. Word-by-word fuzzy matching (for misspellings), precomputed in
+        # the vectorized pass above
+        if word_best is not None and candidate_words:
+            scores.append(word_best[candidate_index] * 0.9)  # Best word match
         
         # 5. Initials matching (e.g., "JS" matches "John Smith")
-        if len(query) <= 4 and all(c.isalpha() for c in query):
+        if initials_exact is not None:
+            if candidate_index in initials_exact:
+                scores.append(0.8)
+            elif candidate_index in initials_partial:
+                scores.append(0.7)
+        elif len(query) <= 4 and all(c.isalpha() for c in query):
             candidate_initials = ''.join([word[0] for word in candidate_words if word])
             if query == candidate_initials:
                 scores.append(0.8)
@@ -216,73 +647,83 @@ def fuzzy_match(query: str, candidates: List[Tuple[str, Any]], threshold: float
                 score = (start_matches / len(query_words)) * 0.75
                 scores.append(score)
         
-        # 7. Advanced fuzzy matching with thefuzz
-        # Use multiple algorithms for comprehensive matching
-        fuzz_ratio = fuzz.ratio(query, clean_candidate) / 100.0
-        fuzz_partial = fuzz.partial_ratio(query, clean_candidate) / 100.0
-        fuzz_token_sort = fuzz.token_sort_ratio(query, clean_candidate) / 100.0
-        fuzz_token_set = fuzz.token_set_ratio(query, clean_candidate) / 100.0
-        
-        # Weighted combination of fuzz scores
-        combined_fuzz = (
-            fuzz_ratio * 0.3 +
-            fuzz_partial * 0.3 +
-            fuzz_token_sort * 0.25 +
-            fuzz_token_set * 0.15
-        )
-        scores.append(combined_fuzz * 0.8)  # Scale down fuzzy scores
-        
-        # 8. Levenshtein distance for typo tolerance
-        if len(query) > 3:  # Only for longer queries
-            try:
-                import Levenshtein
-                # Normalize by max length for relative distance
-                max_len = max(len(query), len(clean_candidate))
-                if max_len > 0:
-                    distance = Levenshtein.distance(query, clean_candidate)
-                    similarity = 1 - (distance / max_len)
-                    if similarity > 0.5:  # Only if reasonably similar
-                        scores.append(similarity * 0.7)
-            except ImportError:
-                # Levenshtein not available, skip this scoring method
-                pass
+        # 7. Weighted combination of the vectorized fuzz scores (computed above)
+        scores.append(float(combined_fuzz[candidate_index]) * 0.8)  # Scale down fuzzy scores
+        
+        # 8. Levenshtein distance for typo tolerance. Its contribution is
+        # capped at 0.7, so skip it when a cheaper scorer already beat that.
+        if len(query) > 3 and (not scores or max(scores) < 0.7):
+            lev_cutoff = max(0.5, min(cutoff / 0.7, 1.0))
+            # Length-difference upper bound on normalized similarity: when
+            # even that can't clear the cutoff, skip the call entirely
+            length_bound = 1.0 - (
+                abs(len(query) - len(clean_candidate))
+                / max(len(query), len(clean_candidate))
+            )
+            if length_bound >= lev_cutoff:
+                similarity = Levenshtein.normalized_similarity(
+                    query, clean_candidate, score_cutoff=lev_cutoff
+                )
+                if similarity > 0.5:  # Only if reasonably similar
+                    scores.append(similarity * 0.7)
         
         # Take the best score from all methods
         if scores:
             final_score = max(scores)
             if final_score >= threshold:
-                results.append((name, value, final_score))
+                add_result(name, value, final_score)
     
-    # Sort results by score (highest first)
+    # Sort results by score (highest first); with a limit, heapq.nlargest is
+    # O(N log k) instead of sorting all N results
+    if limit is not None:
+        return heapq.nlargest(limit, results, key=lambda x: x[2])
     return sorted(results, key=lambda x: x[2], reverse=True)
 
+def _scan_addressbook_db(db_path: str, query: str, params: tuple) -> List[Dict[str, Any]]:
+    """Scan a single AddressBook source database, returning row dicts."""
+    try:
+        conn = _get_db_connection(db_path)
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        # Fetch in batches (as query_messages_db does) so a large address
+        # book never sits in memory twice — once as sqlite rows and once as
+        # the dicts built from them
+        columns = [description[0] for description in cursor.description]
+        cursor.arraysize = 1000
+        results = []
+        rows = cursor.fetchmany()
+        while rows:
+            results.extend(dict(zip(columns, row)) for row in rows)
+            rows = cursor.fetchmany()
+        return results
+    except sqlite3.OperationalError as e:
+        # If we can't access this one, the caller can still use the others
+        print(f"Warning: Cannot access {db_path}: {str(e)}")
+        return []
+
 def query_addressbook_db(query: str, params: tuple = ()) -> List[Dict[str, Any]]:
     """Query the AddressBook database and return results as a list of dictionaries."""
     try:
         # Find the AddressBook database paths
         home_dir = os.path.expanduser("~")
         sources_path = os.path.join(home_dir, "Library/Application Support/AddressBook/Sources/*/AddressBook-v22.abcddb")
-        db_paths = glob.glob(sources_path)
-        
+        db_paths = _addressbook_db_paths()
+
         if not db_paths:
             return [{"error": f"AddressBook database not found at {sources_path} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE."}]
-        
-        # Try each database path until one works
+
+        # Scan the source databases in parallel: they are independent files
+        # and SQLite releases the GIL during C-level query execution
         all_results = []
-        for db_path in db_paths:
-            try:
-                conn = sqlite3.connect(db_path)
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                results = [dict(row) for row in cursor.fetchall()]
-                conn.close()
-                all_results.extend(results)
-            except sqlite3.OperationalError as e:
-                # If we can't access this one, try the next database
-                print(f"Warning: Cannot access {db_path}: {str(e)}")
-                continue
-        
+        if len(db_paths) == 1:
+            all_results = _scan_addressbook_db(db_paths[0], query, params)
+        else:
+            with ThreadPoolExecutor(max_workers=len(db_paths)) as executor:
+                for results in executor.map(
+                    lambda db_path: _scan_addressbook_db(db_path, query, params), db_paths
+                ):
+                    all_results.extend(results)
+
         if not all_results and len(db_paths) > 0:
             return [{"error": f"Could not access any AddressBook databases. Please grant Full Disk Access permission. PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE."}]
             
@@ -340,7 +781,14 @@ def process_contacts(contacts) -> Dict[str, str]:
     """Process contact records into a normalized phone -> name map"""
     contacts_map = {}
     name_to_numbers = {}  # For reverse lookup
-    
+    cleaned_candidates = []  # (name, phone, cleaned name) for fuzzy matching
+    initials_index = {}  # initials -> candidate indices
+    candidate_words = []  # split cleaned names, aligned with cleaned_candidates
+    first_letter_index = {}  # first letter of any name word -> candidate indices
+    cleaned_name_index = {}  # cleaned name -> candidate indices, for exact hits
+    candidate_bytes = []  # ASCII-encoded cleaned names (None when non-ASCII)
+    name_prefix_trie = {}  # char-nested trie over names, words and initials
+
     for contact in contacts:
         try:
             first_name = contact.get("first_name", "")
@@ -355,16 +803,46 @@ def process_contacts(contacts) -> Dict[str, str]:
             if "X-IMAGETYPE" in phone:
                 phone = phone.split("X-IMAGETYPE")[0]
             
-            # Create full name
-            full_name = " ".join(filter(None, [first_name, last_name]))
+            # Create full name. Interned: contacts with several numbers repeat
+            # the same name across the maps, so share one str object (interned
+            # strings also cache their hash for the dict lookups below).
+            full_name = sys.intern(" ".join(filter(None, [first_name, last_name])))
             if not full_name.strip():
                 continue
             
             # Normalize phone number and add to map
-            normalized_phone = normalize_phone_number(phone)
+            normalized_phone = sys.intern(normalize_phone_number(phone))
             if normalized_phone:
                 contacts_map[normalized_phone] = full_name
-                
+                # Pre-insert the US country-code variants so handle lookups
+                # are a single dict probe (setdefault keeps exact numbers
+                # from other contacts winning over variants)
+                if normalized_phone.startswith('1') and len(normalized_phone) > 10:
+                    contacts_map.setdefault(normalized_phone[1:], full_name)
+                elif len(normalized_phone) == 10:
+                    contacts_map.setdefault('1' + normalized_phone, full_name)
+                cleaned = clean_name(full_name).lower().strip()
+                words = cleaned.split()
+                initials = ''.join(word[0] for word in words if word)
+                if initials:
+                    initials_index.setdefault(initials, []).append(len(cleaned_candidates))
+                cleaned_name_index.setdefault(cleaned, []).append(len(cleaned_candidates))
+                for letter in {word[0] for word in words if word}:
+                    first_letter_index.setdefault(letter, []).append(len(cleaned_candidates))
+                # Feed the prefix trie: the full name (covers multi-word
+                # prefixes like "jane d"), every word (covers "smith"), and
+                # the initials string (covers "js")
+                _trie_insert(name_prefix_trie, cleaned, len(cleaned_candidates))
+                for word in set(words):
+                    _trie_insert(name_prefix_trie, word, len(cleaned_candidates))
+                if len(initials) > 1:
+                    _trie_insert(name_prefix_trie, initials, len(cleaned_candidates))
+                cleaned_candidates.append((full_name, normalized_phone, cleaned))
+                candidate_words.append(words)
+                candidate_bytes.append(
+                    cleaned.encode('ascii') if cleaned.isascii() else None
+                )
+
                 # Add to reverse lookup
                 if full_name not in name_to_numbers:
                     name_to_numbers[full_name] = []
@@ -373,11 +851,31 @@ def process_contacts(contacts) -> Dict[str, str]:
             # Skip individual entries that fail to process
             print(f"Error processing contact: {str(e)}")
             continue
-    
-    # Store the reverse lookup in a global variable for later use
-    global _NAME_TO_NUMBERS_MAP
+
+    # Store the reverse lookup and pre-cleaned candidates in globals for later use
+    global _NAME_TO_NUMBERS_MAP, _CLEANED_CANDIDATES, _INITIALS_INDEX, \
+        _CANDIDATE_WORDS, _FIRST_LETTER_INDEX, _CLEANED_NAME_INDEX, \
+        _CANDIDATE_BYTES, _NAME_PREFIX_TRIE, \
+        _CANDIDATE_NAMES, _CANDIDATE_PHONES, _CANDIDATE_CLEANED
     _NAME_TO_NUMBERS_MAP = name_to_numbers
-    
+    _CLEANED_CANDIDATES = cleaned_candidates
+    _INITIALS_INDEX = initials_index
+    _CANDIDATE_WORDS = candidate_words
+    _FIRST_LETTER_INDEX = first_letter_index
+    _CLEANED_NAME_INDEX = cleaned_name_index
+    _NAME_PREFIX_TRIE = name_prefix_trie
+    # Columnar views of the candidate tuples: the fuzzy scorer reads one
+    # field at a time, so parallel arrays keep it off per-contact records
+    _CANDIDATE_NAMES = [c[0] for c in cleaned_candidates]
+    _CANDIDATE_PHONES = [c[1] for c in cleaned_candidates]
+    _CANDIDATE_CLEANED = [c[2] for c in cleaned_candidates]
+    global _INITIALS_BY_CLEANED
+    _INITIALS_BY_CLEANED = {
+        c[2]: ''.join(word[0] for word in words if word)
+        for c, words in zip(cleaned_candidates, candidate_words)
+    }
+    _CANDIDATE_BYTES = candidate_bytes
+
     return contacts_map
 
 def get_addressbook_contacts_subprocess() -> Dict[str, str]:
@@ -449,15 +947,204 @@ def get_addressbook_contacts_subprocess() -> Dict[str, str]:
 # Global variable for reverse contact lookup
 _NAME_TO_NUMBERS_MAP = {}
 
+# Pre-cleaned (name, phone, cleaned name) tuples built by process_contacts so
+# fuzzy searches don't re-run clean_name over every contact per query
+_CLEANED_CANDIDATES = []
+
+# Maps initials strings (e.g. "js") to indices into _CLEANED_CANDIDATES so
+# initials queries don't rebuild each candidate's initials per query
+_INITIALS_INDEX = {}
+
+# Split word lists aligned with _CLEANED_CANDIDATES so the word-prefix
+# matching branch doesn't re-split every candidate name per query
+_CANDIDATE_WORDS = []
+
+# Maps the first letter of each word in a contact's cleaned name to candidate
+# indices, used to prune the scoring pool for a query up front
+_FIRST_LETTER_INDEX = {}
+
+# Maps a cleaned contact name to candidate indices so exact-name queries
+# short-circuit the fuzzy scorer entirely
+_CLEANED_NAME_INDEX = {}
+
+# ASCII byte encodings of the cleaned names, aligned with _CLEANED_CANDIDATES,
+# so the byte-level containment checks don't re-encode per query
+_CANDIDATE_BYTES = []
+
+# Character-nested prefix trie over cleaned names, their words, and their
+# initials. Walking it answers prefix queries in O(|query|) instead of a
+# linear scan over every contact.
+_NAME_PREFIX_TRIE = {}
+
+# Columnar (structure-of-arrays) views over _CLEANED_CANDIDATES, derived in
+# process_contacts and on pickle load; fuzzy_match scans these directly
+_CANDIDATE_NAMES = []
+_CANDIDATE_PHONES = []
+_CANDIDATE_CLEANED = []
+
+# Cleaned name -> its initials string, so match classification doesn't
+# re-split and re-join the same names per result
+_INITIALS_BY_CLEANED = {}
+
+def _trie_insert(trie: Dict, key: str, index: int) -> None:
+    """Insert a key into a nested-dict trie; None marks terminal indices."""
+    node = trie
+    for char in key:
+        node = node.setdefault(char, {})
+    node.setdefault(None, []).append(index)
+
+def _trie_prefix_indices(query: str) -> List[int]:
+    """
+    Walk _NAME_PREFIX_TRIE along the query and collect every candidate index
+    whose inserted key starts with it. Returns an empty list on a miss.
+    """
+    node = _NAME_PREFIX_TRIE
+    for char in query:
+        node = node.get(char)
+        if node is None:
+            return []
+    indices = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        for key, child in current.items():
+            if key is None:
+                indices.extend(child)
+            else:
+                stack.append(child)
+    return indices
+
+# Bumped whenever the contacts cache refreshes so memoized lookups keyed on
+# it (see _find_contact_by_name_cached) invalidate automatically
+_CONTACTS_VERSION = 0
+
+# On-disk copy of the contact cache so short-lived processes skip the
+# AddressBook scan on startup
+_CONTACTS_PICKLE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "mac_messages_mcp", "contacts.pkl"
+)
+
+# Bump when the cached structures change shape so stale caches rebuild
+_CONTACTS_PICKLE_VERSION = 5
+
+def _addressbook_db_paths() -> List[str]:
+    """
+    Return the paths of all AddressBook source databases. os.scandir walks
+    the Sources directory with one readdir and one stat per candidate,
+    roughly half the syscalls of the glob it replaces.
+    """
+    sources_path = os.path.join(
+        os.path.expanduser("~"), "Library/Application Support/AddressBook/Sources"
+    )
+    try:
+        entries = os.scandir(sources_path)
+    except OSError:
+        return []
+    db_paths = []
+    with entries:
+        for entry in entries:
+            if entry.is_dir():
+                db_path = os.path.join(entry.path, "AddressBook-v22.abcddb")
+                if os.path.exists(db_path):
+                    db_paths.append(db_path)
+    return db_paths
+
+def _load_contacts_pickle() -> Optional[Dict[str, str]]:
+    """
+    Load the on-disk contact cache if it is still newer than every
+    AddressBook database. Returns None when stale or unreadable.
+    """
+    try:
+        pickle_mtime = os.path.getmtime(_CONTACTS_PICKLE_PATH)
+        db_paths = _addressbook_db_paths()
+        if not db_paths or any(os.path.getmtime(p) > pickle_mtime for p in db_paths):
+            return None
+        with open(_CONTACTS_PICKLE_PATH, 'rb') as f:
+            (version, contacts_map, name_to_numbers, cleaned_candidates,
+             initials_index, candidate_words, first_letter_index,
+             cleaned_name_index, candidate_bytes,
+             name_prefix_trie) = pickle.load(f)
+        if version != _CONTACTS_PICKLE_VERSION:
+            return None
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        return None
+
+    global _NAME_TO_NUMBERS_MAP, _CLEANED_CANDIDATES, _INITIALS_INDEX, \
+        _CANDIDATE_WORDS, _FIRST_LETTER_INDEX, _CLEANED_NAME_INDEX, \
+        _CANDIDATE_BYTES, _NAME_PREFIX_TRIE, \
+        _CANDIDATE_NAMES, _CANDIDATE_PHONES, _CANDIDATE_CLEANED
+    _NAME_TO_NUMBERS_MAP = name_to_numbers
+    _CLEANED_CANDIDATES = cleaned_candidates
+    _INITIALS_INDEX = initials_index
+    _CANDIDATE_WORDS = candidate_words
+    _FIRST_LETTER_INDEX = first_letter_index
+    _CLEANED_NAME_INDEX = cleaned_name_index
+    _CANDIDATE_BYTES = candidate_bytes
+    _NAME_PREFIX_TRIE = name_prefix_trie
+    # Columnar views are cheap to derive, so they aren't stored in the pickle
+    _CANDIDATE_NAMES = [c[0] for c in cleaned_candidates]
+    _CANDIDATE_PHONES = [c[1] for c in cleaned_candidates]
+    _CANDIDATE_CLEANED = [c[2] for c in cleaned_candidates]
+    global _INITIALS_BY_CLEANED
+    _INITIALS_BY_CLEANED = {
+        c[2]: ''.join(word[0] for word in words if word)
+        for c, words in zip(cleaned_candidates, candidate_words)
+    }
+    return contacts_map
+
+def _save_contacts_pickle(contacts_map: Dict[str, str]) -> None:
+    """Persist the contact cache atomically (write temp file, then rename)."""
+    try:
+        os.makedirs(os.path.dirname(_CONTACTS_PICKLE_PATH), exist_ok=True)
+        tmp_path = _CONTACTS_PICKLE_PATH + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(
+                (_CONTACTS_PICKLE_VERSION, contacts_map, _NAME_TO_NUMBERS_MAP,
+                 _CLEANED_CANDIDATES, _INITIALS_INDEX, _CANDIDATE_WORDS,
+                 _FIRST_LETTER_INDEX, _CLEANED_NAME_INDEX,
+                 _CANDIDATE_BYTES, _NAME_PREFIX_TRIE), f
+            )
+        os.replace(tmp_path, _CONTACTS_PICKLE_PATH)
+    except OSError as e:
+        print(f"Warning: could not persist contacts cache: {e}")
+
 def get_cached_contacts() -> Dict[str, str]:
     """Get cached contacts map or refresh if needed"""
-    global _CONTACTS_CACHE, _LAST_CACHE_UPDATE
-    
+    global _CONTACTS_CACHE, _LAST_CACHE_UPDATE, _CONTACTS_VERSION, \
+        _CONTACTS_MTIME_SIG
+
     current_time = time.time()
     if _CONTACTS_CACHE is None or (current_time - _LAST_CACHE_UPDATE) > _CACHE_TTL:
-        _CONTACTS_CACHE = get_addressbook_contacts()
+        # When the TTL lapses but no AddressBook database changed, the cached
+        # map is still current — just restart the clock instead of rescanning
+        try:
+            mtime_sig = tuple(
+                os.path.getmtime(p) for p in sorted(_addressbook_db_paths())
+            ) or None
+            # An empty path list (no Full Disk Access yet, Sources dir
+            # unreadable) yields no signature: the empty tuple would match
+            # itself forever and suppress the TTL rescan that picks up
+            # contacts once access is granted
+        except OSError:
+            mtime_sig = None
+        if (_CONTACTS_CACHE is not None and mtime_sig is not None
+                and mtime_sig == _CONTACTS_MTIME_SIG):
+            _LAST_CACHE_UPDATE = current_time
+            return _CONTACTS_CACHE
+
+        contacts = None
+        # On cold start, prefer the on-disk cache over the AddressBook scan
+        if _CONTACTS_CACHE is None:
+            contacts = _load_contacts_pickle()
+        if contacts is None:
+            contacts = get_addressbook_contacts()
+            if contacts:
+                _save_contacts_pickle(contacts)
+        _CONTACTS_CACHE = contacts
         _LAST_CACHE_UPDATE = current_time
-    
+        _CONTACTS_MTIME_SIG = mtime_sig
+        _CONTACTS_VERSION += 1
+
     return _CONTACTS_CACHE
 
 def find_group_chat_by_name(name: str, max_results: int = 10) -> List[Dict[str, Any]]:
@@ -486,10 +1173,10 @@ def find_group_chat_by_name(name: str, max_results: int = 10) -> List[Dict[str,
         candidates = [(display, room) for room, display in named_chats.items()]
         
         # Use the same fuzzy matching logic as contacts
-        matches = fuzzy_match(name, candidates, threshold=0.3)
-        
+        matches = fuzzy_match(name, candidates, threshold=0.3, limit=max_results)
+
         results = []
-        for chat_name, room_id, score in matches[:max_results]:
+        for chat_name, room_id, score in matches:
             # Determine match type
             match_type = "fuzzy"
             clean_query = clean_name(name).lower()
@@ -539,20 +1226,83 @@ def find_contact_by_name(name: str, max_results: int = 10) -> List[Dict[str, Any
     """
     if not name or not name.strip():
         return []
-        
+
     contacts = get_cached_contacts()
     if not contacts:
         return []
-    
-    # Build a list of (name, phone) pairs to search through
-    candidates = [(contact_name, phone) for phone, contact_name in contacts.items()]
-    
+
+    # Interactive use repeats the same query (search, select, send), so
+    # memoize on the cleaned query. _CONTACTS_VERSION in the key invalidates
+    # entries whenever the contact cache refreshes. Hand out fresh dicts so
+    # callers can't mutate the memoized entries in place.
+    return [
+        dict(match) for match in _find_contact_by_name_cached(
+            clean_name(name).lower().strip(), max_results, _CONTACTS_VERSION
+        )
+    ]
+
+@functools.lru_cache(maxsize=256)
+def _find_contact_by_name_cached(name: str, max_results: int, cache_version: int) -> List[Dict[str, Any]]:
+    """Memoized body of find_contact_by_name; name must already be cleaned."""
+    contacts = get_cached_contacts()
+
+    # Exact cleaned-name hits need no fuzzy scoring at all: one dict probe
+    # against the index built in process_contacts answers them
+    exact_indices = _CLEANED_NAME_INDEX.get(name)
+    if exact_indices:
+        return [
+            {
+                "name": _CLEANED_CANDIDATES[i][0],
+                "phone": _CLEANED_CANDIDATES[i][1],
+                "score": 1.0,
+                "match_type": "exact",
+                "confidence": "very_high",
+                "normalized_phone": _CLEANED_CANDIDATES[i][1],
+            }
+            for i in exact_indices[:max_results]
+        ]
+
+    # Prefix fast path: a trie walk answers "query is a prefix of a name,
+    # word, or initials" in O(|query|). Only short-circuit when the hits are
+    # few and unambiguous enough to skip ranking; broad prefixes (single
+    # letters, common stems) still go through the fuzzy scorer below.
+    if _NAME_PREFIX_TRIE and len(name) >= 2:
+        prefix_hits = sorted(set(_trie_prefix_indices(name)))
+        if prefix_hits and len(prefix_hits) <= max_results:
+            results = []
+            for i in prefix_hits:
+                contact_name, phone, cleaned = _CLEANED_CANDIDATES[i]
+                words = _CANDIDATE_WORDS[i]
+                if cleaned.startswith(name) or any(
+                    word.startswith(name) for word in words
+                ):
+                    match_type, score, confidence = "partial", 0.95, "very_high"
+                else:
+                    # Hit came through the initials key
+                    match_type, score, confidence = "initials", 0.8, "high"
+                results.append({
+                    "name": contact_name,
+                    "phone": phone,
+                    "score": score,
+                    "match_type": match_type,
+                    "confidence": confidence,
+                    "normalized_phone": phone,
+                })
+            results.sort(key=lambda match: match["score"], reverse=True)
+            return results
+
+    # Use the pre-cleaned candidates built by process_contacts when available
+    if _CLEANED_CANDIDATES:
+        candidates = _CLEANED_CANDIDATES
+    else:
+        candidates = [(contact_name, phone) for phone, contact_name in contacts.items()]
+
     # Perform enhanced fuzzy matching with lower threshold for better recall
-    matches = fuzzy_match(name, candidates, threshold=0.3)
-    
+    matches = fuzzy_match(name, candidates, threshold=0.3, limit=max_results)
+
     # Convert to a list of contact dictionaries with enhanced metadata
     results = []
-    for contact_name, phone, score in matches[:max_results]:
+    for contact_name, phone, score in matches:
         # Determine match type for better user understanding
         match_type = "fuzzy"
         clean_query = clean_name(name).lower()
@@ -563,8 +1313,11 @@ def find_contact_by_name(name: str, max_results: int = 10) -> List[Dict[str, Any
         elif clean_query in clean_contact:
             match_type = "partial"
         elif len(clean_query) <= 4 and all(c.isalpha() for c in clean_query):
-            # Check if it might be initials
-            initials = ''.join([word[0] for word in clean_contact.split() if word])
+            # Check if it might be initials, via the precomputed map when the
+            # contact came from the cache
+            initials = _INITIALS_BY_CLEANED.get(clean_contact)
+            if initials is None:
+                initials = ''.join([word[0] for word in clean_contact.split() if word])
             if clean_query == initials or clean_query in initials:
                 match_type = "initials"
         
@@ -589,6 +1342,28 @@ def find_contact_by_name(name: str, max_results: int = 10) -> List[Dict[str, Any
     
     return results
 
+# One anchored match classifies a recipient's shape (selection marker,
+# phone-shaped, or email) so the common direct-send cases never reach the
+# fuzzy contact engine. Group order mirrors the old branch order.
+_RECIPIENT_KIND_RE = re.compile(
+    r'(?:(?P<selection>contact:)'
+    r'|(?P<phone>[0-9+\- ()]+\Z)'
+    r'|(?P<email>[^@]*@))',
+    re.IGNORECASE,
+)
+
+# Formatting constants for match listings, hoisted so the response loops in
+# send_message don't rebuild dict literals per row
+_CONFIDENCE_EMOJI = {
+    'very_high': '🟢', 'high': '🟡', 'medium': '🟠', 'low': '🔴'
+}
+_MATCH_TYPE_INFO = {
+    'exact': ' (exact match)',
+    'partial': ' (partial match)',
+    'initials': ' (initials match)',
+    'fuzzy': ' (fuzzy match)'
+}
+
 def send_message(recipient: str, message: str, group_chat: bool = False) -> str:
     """
     Send a message using the Messages app with enhanced contact and group chat resolution.
@@ -609,9 +1384,12 @@ def send_message(recipient: str, message: str, group_chat: bool = False) -> str:
     
     if not recipient:
         return "Error: Recipient cannot be empty."
-    
+
+    kind_match = _RECIPIENT_KIND_RE.match(recipient)
+    recipient_kind = kind_match.lastgroup if kind_match else None
+
     # Handle contact selection format (contact:N)
-    if recipient.lower().startswith("contact:"):
+    if recipient_kind == "selection":
         try:
             # Get the selected index (1-based)
             index = int(recipient.split(":", 1)[1].strip()) - 1
@@ -637,13 +1415,13 @@ def send_message(recipient: str, message: str, group_chat: bool = False) -> str:
             return f"Error selecting contact: {str(e)}"
     
     # Check if recipient is directly a phone number or email
-    if all(c.isdigit() or c in '+- ()' for c in recipient) or '@' in recipient:
+    if recipient_kind is not None:
         # Clean the phone number or use email as-is
-        if '@' in recipient:
+        if recipient_kind == "email":
             clean_recipient = recipient
             recipient_type = "email"
         else:
-            clean_recipient = ''.join(c for c in recipient if c.isdigit())
+            clean_recipient = normalize_phone_number(recipient)
             recipient_type = "phone number"
         
         result = _send_message_to_recipient(clean_recipient, message, group_chat=group_chat)
@@ -678,15 +1456,8 @@ def send_message(recipient: str, message: str, group_chat: bool = False) -> str:
                 response_lines = [f"Found {len(group_chats)} group chats matching '{recipient}':"]
                 
                 for i, chat in enumerate(group_chats[:5]):
-                    confidence_emoji = {
-                        'very_high': '🟢', 'high': '🟡', 'medium': '🟠', 'low': '🔴'
-                    }.get(chat.get('confidence', 'unknown'), '⚪')
-                    
-                    match_type_info = {
-                        'exact': ' (exact match)',
-                        'partial': ' (partial match)', 
-                        'fuzzy': ' (fuzzy match)'
-                    }.get(chat.get('match_type', 'fuzzy'), '')
+                    confidence_emoji = _CONFIDENCE_EMOJI.get(chat.get('confidence', 'unknown'), '⚪')
+                    match_type_info = _MATCH_TYPE_INFO.get(chat.get('match_type', 'fuzzy'), '')
                     
                     score_display = f" [{chat['score']:.1%}]" if chat.get('score') else ""
                     
@@ -734,19 +1505,8 @@ def send_message(recipient: str, message: str, group_chat: bool = False) -> str:
         response_lines = [f"Found {len(contacts)} contacts matching '{recipient}':"]
         
         for i, contact in enumerate(contacts[:10]):  # Show top 10
-            confidence_emoji = {
-                'very_high': '🟢',
-                'high': '🟡', 
-                'medium': '🟠',
-                'low': '🔴'
-            }.get(contact.get('confidence', 'unknown'), '⚪')
-            
-            match_type_info = {
-                'exact': ' (exact match)',
-                'partial': ' (partial match)',
-                'initials': ' (initials match)', 
-                'fuzzy': ' (fuzzy match)'
-            }.get(contact.get('match_type', 'fuzzy'), '')
+            confidence_emoji = _CONFIDENCE_EMOJI.get(contact.get('confidence', 'unknown'), '⚪')
+            match_type_info = _MATCH_TYPE_INFO.get(contact.get('match_type', 'fuzzy'), '')
             
             score_display = f" [{contact['score']:.1%}]" if contact.get('score') else ""
             
@@ -766,7 +1526,7 @@ send_message.recent_matches = []
 
 def _send_message_to_recipient(recipient: str, message: str, contact_name: str = None, group_chat: bool = False) -> str:
     """
-    Internal function to send a message to a specific recipient using file-based approach.
+    Internal function to send a message to a specific recipient.
     
     Args:
         recipient: Phone number or email
@@ -778,26 +1538,23 @@ def _send_message_to_recipient(recipient: str, message: str, contact_name: str =
         Success or error message
     """
     try:
-        # Create a temporary file with the message content
-        file_path = os.path.abspath('imessage_tmp.txt')
-        
-        with open(file_path, 'w') as f:
-            f.write(message)
-        
+        # Embed the message as a quoted AppleScript literal instead of
+        # round-tripping it through a temp file: no open/write/unlink per
+        # send, and nothing left behind on failure
+        safe_message = message.translate(_APPLESCRIPT_ESCAPE)
+        safe_recipient = recipient.translate(_APPLESCRIPT_ESCAPE)
+
         # Adjust the AppleScript command based on whether this is a group chat
         if not group_chat:
-            command = f'tell application "Messages" to send (read (POSIX file "{file_path}") as «class utf8») to participant "{recipient}" of (1st service whose service type = iMessage)'
+            command = f'tell application "Messages" to send "{safe_message}" to participant "{safe_recipient}" of (1st service whose service type = iMessage)'
         else:
-            command = f'tell application "Messages" to send (read (POSIX file "{file_path}") as «class utf8») to chat "{recipient}"'
-        
-        # Run the AppleScript
-        result = run_applescript(command)
-        
-        # Clean up the temporary file
-        try:
-            os.remove(file_path)
-        except:
-            pass
+            command = f'tell application "Messages" to send "{safe_message}" to chat "{safe_recipient}"'
+
+        # Run the AppleScript via the persistent pipe, falling back to a
+        # one-shot osascript when the pipe is unavailable
+        result = _run_applescript_piped(command)
+        if result is None:
+            result = run_applescript(command)
         
         # Check result
         if result.startswith("Error:"):
@@ -811,64 +1568,115 @@ def _send_message_to_recipient(recipient: str, message: str, contact_name: str =
         # Try fallback method
         return _send_message_direct(recipient, message, contact_name, group_chat)
 
-def get_contact_name(handle_id: int) -> str:
+# handle ROWID -> (handle value, chat display name) lookup table, loaded in
+# one query instead of 1-2 queries per resolved message row
+_HANDLE_MAP_CACHE = None
+_HANDLE_MAP_UPDATE = 0
+_HANDLE_MAP_MTIME = None
+
+# normalized phone -> handle ROWID, rebuilt with the handle map. Answers the
+# handle-miss fallback with a dict probe instead of a LIKE scan over message
+_NORMALIZED_HANDLE_INDEX = {}
+
+def _get_handle_map() -> Dict[int, Tuple[str, Optional[str]]]:
     """
-    Get contact name from handle_id with improved contact lookup.
+    Map each handle ROWID to its id (phone/email) and a chat display name,
+    cached with the same TTL + mtime policy as the chat mapping.
     """
-    if handle_id is None:
-        return "Unknown"
-        
-    # First, get the phone number or email
-    handle_query = """
-    SELECT id FROM handle WHERE ROWID = ?
+    global _HANDLE_MAP_CACHE, _HANDLE_MAP_UPDATE, _HANDLE_MAP_MTIME
+
+    current_time = time.time()
+    if _HANDLE_MAP_CACHE is not None and (current_time - _HANDLE_MAP_UPDATE) <= _CHAT_MAPPING_TTL:
+        return _HANDLE_MAP_CACHE
+
+    try:
+        mtime = os.path.getmtime(get_messages_db_path())
+    except OSError:
+        mtime = None
+
+    if _HANDLE_MAP_CACHE is not None and mtime is not None and mtime == _HANDLE_MAP_MTIME:
+        _HANDLE_MAP_UPDATE = current_time
+        return _HANDLE_MAP_CACHE
+
+    # MAX() prefers a non-empty display name over empty/NULL ones; the chat
+    # count lets the normalized index prefer direct-message handles, matching
+    # the ordering find_handle_by_phone's query encodes
+    query = """
+    SELECT
+        h.ROWID AS handle_rowid,
+        h.id AS handle_value,
+        MAX(c.display_name) AS display_name,
+        COUNT(DISTINCT chj.chat_id) AS chat_count
+    FROM handle h
+    LEFT JOIN chat_handle_join chj ON h.ROWID = chj.handle_id
+    LEFT JOIN chat c ON chj.chat_id = c.ROWID
+    GROUP BY h.ROWID, h.id
     """
-    handles = query_messages_db(handle_query, (handle_id,))
-    
-    if not handles or "error" in handles[0]:
-        return "Unknown"
-    
-    handle_id_value = handles[0]["id"]
-    
-    # Try to match with AddressBook contacts
-    contacts = get_cached_contacts()
-    normalized_handle = normalize_phone_number(handle_id_value)
-    
-    # Try different variations of the number for matching
-    if normalized_handle in contacts:
-        return contacts[normalized_handle]
-    
-    # Sometimes numbers in the addressbook have the country code, but messages don't
-    if normalized_handle.startswith('1') and len(normalized_handle) > 10:
-        # Try without country code
-        if normalized_handle[1:] in contacts:
-            return contacts[normalized_handle[1:]]
-    elif len(normalized_handle) == 10:  # US number without country code
-        # Try with country code
-        if '1' + normalized_handle in contacts:
-            return contacts['1' + normalized_handle]
-    
-    # If no match found in AddressBook, fall back to display name from chat
-    contact_query = """
-    SELECT 
-        c.display_name 
-    FROM 
-        handle h
-    JOIN 
-        chat_handle_join chj ON h.ROWID = chj.handle_id
-    JOIN 
-        chat c ON chj.chat_id = c.ROWID
-    WHERE 
-        h.id = ? 
-    LIMIT 1
+    rows = query_messages_db(query)
+
+    handle_map = {}
+    normalized_index = {}
+    index_rank = {}  # key -> (chat_count, rowid) of the entry currently held
+    if not rows or "error" not in rows[0]:
+        for row in rows:
+            handle_map[row["handle_rowid"]] = (row["handle_value"], row["display_name"])
+            normalized = normalize_phone_number(row["handle_value"] or "")
+            if normalized:
+                rank = (row["chat_count"], row["handle_rowid"])
+                keys = [normalized]
+                # Same US country-code variants as the contacts map
+                if normalized.startswith('1') and len(normalized) > 10:
+                    keys.append(normalized[1:])
+                elif len(normalized) == 10:
+                    keys.append('1' + normalized)
+                for key in keys:
+                    if key not in index_rank or rank < index_rank[key]:
+                        index_rank[key] = rank
+                        normalized_index[key] = row["handle_rowid"]
+
+    global _NORMALIZED_HANDLE_INDEX
+    _NORMALIZED_HANDLE_INDEX = normalized_index
+    _HANDLE_MAP_CACHE = handle_map
+    _HANDLE_MAP_UPDATE = current_time
+    _HANDLE_MAP_MTIME = mtime
+
+    return handle_map
+
+def resolve_handle_name(handle_value: Optional[str], contacts: Dict[str, str],
+                        display_name: Optional[str] = None) -> str:
     """
-    
-    contacts = query_messages_db(contact_query, (handle_id_value,))
-    
-    if contacts and len(contacts) > 0 and "display_name" in contacts[0] and contacts[0]["display_name"]:
-        return contacts[0]["display_name"]
-    
+    Resolve a handle's phone number or email to a contact name using the
+    cached contacts map, without any per-call handle lookups. Falls back to
+    the supplied chat display name, then to the raw handle value.
+    """
+    if not handle_value:
+        return "Unknown"
+
+    # All number variants are pre-inserted at cache-build time, so a single
+    # dict probe replaces the per-call with/without-country-code branches
+    name = contacts.get(normalize_phone_number(handle_value))
+    if name:
+        return name
+
+    # If no match found in AddressBook, fall back to display name from chat
+    if display_name:
+        return display_name
+
     # If no contact name found, return the phone number or email
-    return handle_id_value
+    return handle_value
+
+def get_contact_name(handle_id: int) -> str:
+    """
+    Get contact name from handle_id with improved contact lookup.
+    """
+    if handle_id is None:
+        return "Unknown"
+
+    handle_value, display_name = _get_handle_map().get(handle_id, (None, None))
+    if not handle_value:
+        return "Unknown"
+
+    return resolve_handle_name(handle_value, get_cached_contacts(), display_name)
 
 def get_recent_messages(hours: int = 24, contact: Optional[str] = None) -> str:
     """
@@ -928,8 +1736,9 @@ def get_recent_messages(hours: int = 24, contact: Optional[str] = None) -> str:
             except Exception as e:
                 return f"Error processing contact selection: {str(e)}"
         
-        # Check if contact might be a name rather than a phone number or email
-        if not all(c.isdigit() or c in '+- ()@.' for c in contact):
+        # Check if contact might be a name rather than a phone number or
+        # email (C-level translate instead of a per-char Python generator)
+        if contact.translate(_PHONE_EMAIL_CHARS):
             # Try fuzzy matching
             matches = find_contact_by_name(contact)
             
@@ -960,22 +1769,19 @@ def get_recent_messages(hours: int = 24, contact: Optional[str] = None) -> str:
             handle_id = find_handle_by_phone(contact)
             
         if not handle_id:
-            # Try a direct search in message table to see if any messages exist
+            # Probe the in-memory normalized-handle index instead of the old
+            # LIKE '%...%' join over message, which forced a full scan
             normalized = normalize_phone_number(contact)
-            query = """
-            SELECT COUNT(*) as count 
-            FROM message m
-            JOIN handle h ON m.handle_id = h.ROWID
-            WHERE h.id LIKE ?
-            """
-            results = query_messages_db(query, (f"%{normalized}%",))
-            
-            if results and not "error" in results[0] and results[0].get("count", 0) == 0:
-                # No messages found but the query was valid
-                return f"No message history found with '{contact}'."
-            else:
-                # Could not find the handle at all
-                return f"Could not find any messages with contact '{contact}'. Verify the phone number or email is correct."
+            _get_handle_map()  # refresh the index alongside the handle map
+            fallback_rowid = _NORMALIZED_HANDLE_INDEX.get(normalized)
+            if fallback_rowid is not None:
+                query = "SELECT COUNT(*) as count FROM message WHERE handle_id = ?"
+                results = query_messages_db(query, (fallback_rowid,))
+                if results and not "error" in results[0] and results[0].get("count", 0) == 0:
+                    # No messages found but the handle exists
+                    return f"No message history found with '{contact}'."
+            # Could not find the handle at all
+            return f"Could not find any messages with contact '{contact}'. Verify the phone number or email is correct."
     
     # Calculate the timestamp for X hours ago
     current_time = datetime.now(timezone.utc)
@@ -986,12 +1792,10 @@ def get_recent_messages(hours: int = 24, contact: Optional[str] = None) -> str:
     apple_epoch = datetime(2001, 1, 1, tzinfo=timezone.utc)
     seconds_since_apple_epoch = (hours_ago - apple_epoch).total_seconds()
     
-    # Convert to nanoseconds (Apple's format)
-    nanoseconds_since_apple_epoch = int(seconds_since_apple_epoch * 1_000_000_000)
-    
-    # Make sure we're using a string representation for the timestamp
-    # to avoid integer overflow issues when binding to SQLite
-    timestamp_str = str(nanoseconds_since_apple_epoch)
+    # Convert to nanoseconds (Apple's format). SQLite binds 64-bit ints
+    # natively, and an untouched m.date lets the (date, handle_id) index
+    # serve the range predicate instead of a full scan.
+    timestamp_ns = int(seconds_since_apple_epoch * 1_000_000_000)
     
     # Build the SQL query - use attributedBody field and text
     query = """
@@ -1002,19 +1806,22 @@ def get_recent_messages(hours: int = 24, contact: Optional[str] = None) -> str:
         m.attributedBody,
         m.is_from_me,
         m.handle_id,
-        m.cache_roomnames
+        m.cache_roomnames,
+        h.id AS handle_value
     FROM 
         message m
+    LEFT JOIN
+        handle h ON m.handle_id = h.ROWID
     WHERE 
-        CAST(m.date AS TEXT) > ? 
+        m.date > ? 
     """
     
-    params = (timestamp_str,)
+    params = (timestamp_ns,)
     
     # Add contact filter if handle_id was found
     if handle_id:
         query += "AND m.handle_id = ? "
-        params = (timestamp_str, handle_id)
+        params = (timestamp_ns, handle_id)
     
     query += "ORDER BY m.date DESC LIMIT 100"
     
@@ -1028,9 +1835,12 @@ def get_recent_messages(hours: int = 24, contact: Optional[str] = None) -> str:
     if "error" in messages[0]:
         return f"Error accessing messages: {messages[0]['error']}"
     
-    # Get chat mapping for group chat names
+    # Get chat mapping for group chat names and resolve sender names against
+    # the cached contacts map (the handle value is joined into each row)
     chat_mapping = get_chat_mapping()
-    
+    contacts = get_cached_contacts()
+    handle_map = _get_handle_map()
+
     formatted_messages = []
     for msg in messages:
         # Get the message content from text or attributedBody
@@ -1047,25 +1857,27 @@ def get_recent_messages(hours: int = 24, contact: Optional[str] = None) -> str:
         
         # Convert Apple timestamp to readable date
         try:
-            # Convert Apple timestamp to datetime
-            date_string = '2001-01-01'
-            mod_date = datetime.strptime(date_string, '%Y-%m-%d')
-            unix_timestamp = int(mod_date.timestamp()) * 1000000000
-            
             # Handle both nanosecond and second format timestamps
             msg_timestamp = int(msg["date"])
-            if len(str(msg_timestamp)) > 10:  # It's in nanoseconds
-                new_date = int((msg_timestamp + unix_timestamp) / 1000000000)
+            if msg_timestamp >= 10_000_000_000:  # It's in nanoseconds
+                msg_seconds = msg_timestamp / 1_000_000_000
             else:  # It's already in seconds
-                new_date = mod_date.timestamp() + msg_timestamp
-                
-            date_str = datetime.fromtimestamp(new_date).strftime("%Y-%m-%d %H:%M:%S")
+                msg_seconds = msg_timestamp
+
+            date_val = datetime.fromtimestamp(msg_seconds + _APPLE_EPOCH_UNIX, tz=timezone.utc)
+            date_str = date_val.astimezone().strftime("%Y-%m-%d %H:%M:%S")
         except (ValueError, TypeError, OverflowError) as e:
             # If conversion fails, use a placeholder
             date_str = "Unknown date"
             print(f"Date conversion error: {e} for timestamp {msg['date']}")
         
-        direction = "You" if msg["is_from_me"] else get_contact_name(msg["handle_id"])
+        if msg["is_from_me"]:
+            direction = "You"
+        else:
+            handle_value, display_name = handle_map.get(
+                msg["handle_id"], (msg.get("handle_value"), None)
+            )
+            direction = resolve_handle_name(handle_value, contacts, display_name)
         
         # Check if this is a group chat
         group_chat_name = None
@@ -1092,7 +1904,7 @@ get_recent_messages.recent_matches = []
 def fuzzy_search_messages(
     search_term: str,
     hours: int = 24,
-    threshold: float = 0.6,  # Default threshold adjusted for thefuzz
+    threshold: float = 0.6,  # Default threshold adjusted for WRatio scoring
 ) -> str:
     """
     Fuzzy search for messages containing the search_term within the last N hours.
@@ -1127,66 +1939,118 @@ def fuzzy_search_messages(
     apple_epoch = datetime(2001, 1, 1, tzinfo=timezone.utc)
     seconds_since_apple_epoch = (hours_ago_dt - apple_epoch).total_seconds()
     
-    # Convert to nanoseconds (Apple's format)
-    nanoseconds_since_apple_epoch = int(seconds_since_apple_epoch * 1_000_000_000)
-    timestamp_str = str(nanoseconds_since_apple_epoch)
+    # Convert to nanoseconds (Apple's format); bound as a 64-bit int so the
+    # date index can serve the range predicate
+    timestamp_ns = int(seconds_since_apple_epoch * 1_000_000_000)
 
-    # Build the SQL query to get all messages in the time window
-    # Limiting to 500 messages to avoid performance issues with very large message histories.
-    query = """
-    SELECT
-        m.ROWID,
-        m.date,
-        m.text,
-        m.attributedBody,
-        m.is_from_me,
-        m.handle_id,
-        m.cache_roomnames
-    FROM
-        message m
-    WHERE
-        CAST(m.date AS TEXT) > ?
-    ORDER BY m.date DESC
-    LIMIT 500
-    """
-    params = (timestamp_str,)
-    raw_messages = query_messages_db(query, params)
+    # Coarse prefilter pushed into SQLite: rows whose text contains none of
+    # the search tokens never cross into Python, so the 500-row cap is spent
+    # on likely hits. attributedBody-only rows (text NULL) pass through for
+    # Python-side decoding. When the filter matches nothing (e.g. the search
+    # term is misspelled) we rerun unfiltered so fuzzy scoring still applies.
+    # Tokens under 3 chars match nearly everything and just add LIKE work,
+    # so only longer tokens become filter terms
+    filter_tokens = [
+        t for t in clean_name(search_term).lower().split() if len(t) >= 3
+    ]
+    token_filter = ""
+    token_params = ()
+    if filter_tokens:
+        likes = " OR ".join("m.text LIKE ? ESCAPE '\\'" for _ in filter_tokens)
+        token_filter = f" AND (m.text IS NULL OR {likes})"
+        token_params = tuple(
+            "%" + t.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            for t in filter_tokens
+        )
 
-    if not raw_messages:
-        return f"No messages found in the last {hours} hours to search."
-    if "error" in raw_messages[0]:
-        return f"Error accessing messages: {raw_messages[0]['error']}"
+    # Limiting to 500 messages to avoid performance issues with very large
+    # message histories.
+    for attempt_filter, attempt_params in ((token_filter, token_params), ("", ())):
+        query = f"""
+        SELECT
+            m.ROWID,
+            m.date,
+            m.text,
+            m.attributedBody,
+            m.is_from_me,
+            m.handle_id,
+            m.cache_roomnames,
+            h.id AS handle_value
+        FROM
+            message m
+        LEFT JOIN
+            handle h ON m.handle_id = h.ROWID
+        WHERE
+            m.date > ?{attempt_filter}
+        ORDER BY m.date DESC
+        LIMIT 500
+        """
+        params = (timestamp_ns,) + attempt_params
 
-    message_candidates = []
-    for msg_dict in raw_messages:
-        body = msg_dict.get("text") or extract_body_from_attributed(
-            msg_dict.get("attributedBody")
-        )
-        if body and body.strip():
-            message_candidates.append((body, msg_dict))
+        # Stream rows in batches rather than materializing all 500 up front
+        row_count = 0
+        message_candidates = []
+        for msg_dict in query_messages_db_iter(query, params):
+            if "error" in msg_dict:
+                return f"Error accessing messages: {msg_dict['error']}"
+            row_count += 1
+            body = msg_dict.get("text") or extract_body_from_attributed(
+                msg_dict.get("attributedBody")
+            )
+            if body and body.strip():
+                message_candidates.append((body, msg_dict))
+
+        if message_candidates or not attempt_filter:
+            break
 
+    if row_count == 0:
+        return f"No messages found in the last {hours} hours to search."
     if not message_candidates:
         return f"No message content found to search in the last {hours} hours."
 
-    # --- New fuzzy matching logic using thefuzz ---
+    # --- Fuzzy matching logic using rapidfuzz ---
     cleaned_search_term = clean_name(search_term).lower()
-    # thefuzz scores are 0-100. Scale the input threshold (0.0-1.0).
+    # rapidfuzz scores are 0-100. Scale the input threshold (0.0-1.0).
     scaled_threshold = threshold * 100
 
-    matched_messages_with_scores = []
-    for original_message_text, msg_dict_value in message_candidates:
-        # We use the original_message_text for matching, which might contain HTML entities etc.
-        # clean_name will handle basic cleaning like emoji removal.
-        cleaned_candidate_text = clean_name(original_message_text).lower()
+    # Cheap prefilter: only score messages sharing at least one literal token
+    # with the search term. When nothing contains a token (e.g. the search
+    # term is misspelled), keep the full pool so fuzzy scoring still applies.
+    search_tokens = cleaned_search_term.split()
+    if search_tokens:
+        prefiltered = [
+            (original_message_text, msg_dict_value)
+            for original_message_text, msg_dict_value in message_candidates
+            if any(token in original_message_text.lower() for token in search_tokens)
+        ]
+        if prefiltered:
+            message_candidates = prefiltered
 
-        # Using WRatio for a good balance of matching strategies.
-        score_from_thefuzz = fuzz.WRatio(cleaned_search_term, cleaned_candidate_text)
+    # We match against the original message text (which might contain HTML
+    # entities etc.); clean_name handles basic cleaning like emoji removal.
+    # cdist scores every candidate in one parallel C++ pass instead of a
+    # WRatio call per message from Python.
+    cleaned_texts = [
+        clean_name(original_message_text).lower()
+        for original_message_text, _ in message_candidates
+    ]
+    # WRatio runs four scorers and keeps the max. For short search terms
+    # substring matching is what matters, and partial_ratio alone covers it
+    # at roughly a quarter of the cost; longer phrases still get WRatio's
+    # token reordering. 8 chars ~ one word.
+    scorer = fuzz.partial_ratio if len(cleaned_search_term) <= 8 else fuzz.WRatio
+    match_scores = process.cdist(
+        [cleaned_search_term], cleaned_texts,
+        scorer=scorer, score_cutoff=scaled_threshold,
+        workers=-1, dtype=np.float32,
+    )[0]
 
-        if score_from_thefuzz >= scaled_threshold:
-            # Store score as 0.0-1.0 for consistency with how threshold is defined
-            matched_messages_with_scores.append(
-                (original_message_text, msg_dict_value, score_from_thefuzz / 100.0)
-            )
+    matched_messages_with_scores = [
+        # Store score as 0.0-1.0 for consistency with how threshold is defined
+        (message_candidates[i][0], message_candidates[i][1], float(score) / 100.0)
+        for i, score in enumerate(match_scores)
+        if score >= scaled_threshold
+    ]
     matched_messages_with_scores.sort(
         key=lambda x: x[2], reverse=True
     )  # Sort by score desc
@@ -1195,41 +2059,45 @@ def fuzzy_search_messages(
         return f"No messages found matching '{search_term}' with a threshold of {threshold} in the last {hours} hours."
 
     chat_mapping = get_chat_mapping()
+    contacts = get_cached_contacts()
+    handle_map = _get_handle_map()
     formatted_results = []
-    for _matched_text, msg_dict, score in matched_messages_with_scores:
-        original_body = (
-            msg_dict.get("text")
-            or extract_body_from_attributed(msg_dict.get("attributedBody"))
-            or "[No displayable content]"
-        )
+    for matched_text, msg_dict, score in matched_messages_with_scores:
+        # The candidate body was already decoded (text or attributedBody)
+        # when the scoring pool was built; reuse it instead of running
+        # extract_body_from_attributed a second time per matched row
+        original_body = matched_text
 
-        apple_offset = (
-            978307200  # Seconds between Unix epoch and Apple epoch (2001-01-01)
-        )
         msg_timestamp_ns = int(msg_dict["date"])
         # Ensure timestamp is in seconds for fromtimestamp
         msg_timestamp_s = (
             msg_timestamp_ns / 1_000_000_000
-            if len(str(msg_timestamp_ns)) > 10
+            if msg_timestamp_ns >= 10_000_000_000
             else msg_timestamp_ns
         )
         date_val = datetime.fromtimestamp(
-            msg_timestamp_s + apple_offset, tz=timezone.utc
+            msg_timestamp_s + _APPLE_EPOCH_UNIX, tz=timezone.utc
         )
         date_str = date_val.astimezone().strftime("%Y-%m-%d %H:%M:%S")
 
-        direction = (
-            "You" if msg_dict["is_from_me"] else get_contact_name(msg_dict["handle_id"])
-        )
+        if msg_dict["is_from_me"]:
+            direction = "You"
+        else:
+            handle_value, display_name = handle_map.get(
+                msg_dict["handle_id"], (msg_dict.get("handle_value"), None)
+            )
+            direction = resolve_handle_name(handle_value, contacts, display_name)
         group_chat_name = (
             chat_mapping.get(msg_dict.get("cache_roomnames"))
             if msg_dict.get("cache_roomnames")
             else None
         )
-        message_prefix = f"[{date_str}] (Score: {score:.2f})" + (
-            f" [{group_chat_name}]" if group_chat_name else ""
+        # One f-string per row; no intermediate prefix strings
+        formatted_results.append(
+            f"[{date_str}] (Score: {score:.2f})"
+            f"{f' [{group_chat_name}]' if group_chat_name else ''}"
+            f" {direction}: {original_body}"
         )
-        formatted_results.append(f"{message_prefix} {direction}: {original_body}")
 
     return (
         f"Found {len(matched_messages_with_scores)} messages matching '{search_term}':\n"
@@ -1237,23 +2105,14 @@ def fuzzy_search_messages(
     )
 
 
-def _check_imessage_availability(recipient: str) -> bool:
-    """
-    Check if recipient has iMessage available.
-    
-    Args:
-        recipient: Phone number or email to check
-        
-    Returns:
-        True if iMessage is available, False otherwise
-    """
-    safe_recipient = recipient.replace('"', '\\"')
-    
-    script = f'''
+
+# AppleScript templates for the send paths, parsed once at import instead of
+# rebuilding each multi-line script via f-string on every call
+_IMESSAGE_CHECK_TEMPLATE = string.Template('''
     tell application "Messages"
         try
             set targetService to 1st service whose service type = iMessage
-            set targetBuddy to buddy "{safe_recipient}" of targetService
+            set targetBuddy to buddy "${safe_recipient}" of targetService
             
             -- Check if buddy exists and has iMessage capability
             if targetBuddy exists then
@@ -1265,37 +2124,16 @@ def _check_imessage_availability(recipient: str) -> bool:
             return "false"
         end try
     end tell
-    '''
-    
-    try:
-        result = run_applescript(script)
-        return result.strip().lower() == "true"
-    except:
-        return False
+    ''')
 
-def _send_message_sms(recipient: str, message: str, contact_name: str = None) -> str:
-    """
-    Send message via SMS/RCS using AppleScript.
-    
-    Args:
-        recipient: Phone number to send to
-        message: Message content
-        contact_name: Optional contact name for display
-        
-    Returns:
-        Success or error message
-    """
-    safe_message = message.replace('"', '\\"').replace('\\', '\\\\')
-    safe_recipient = recipient.replace('"', '\\"')
-    
-    script = f'''
+_SMS_TEMPLATE = string.Template('''
     tell application "Messages"
         try
             -- Try to find SMS service
             set smsService to first account whose service type = SMS and enabled is true
             
             -- Send message via SMS
-            send "{safe_message}" to participant "{safe_recipient}" of smsService
+            send "${safe_message}" to participant "${safe_recipient}" of smsService
             
             -- Wait briefly to check for immediate errors
             delay 1
@@ -1305,54 +2143,16 @@ def _send_message_sms(recipient: str, message: str, contact_name: str = None) ->
             return "error:" & errMsg
         end try
     end tell
-    '''
-    
-    try:
-        result = run_applescript(script)
-        if result.startswith("error:"):
-            return f"Error sending SMS: {result[6:]}"
-        elif result.strip() == "success":
-            display_name = contact_name if contact_name else recipient
-            return f"SMS sent successfully to {display_name}"
-        else:
-            return f"Unknown SMS result: {result}"
-    except Exception as e:
-        return f"Error sending SMS: {str(e)}"
+    ''')
 
-def _send_message_direct(
-    recipient: str, message: str, contact_name: str = None, group_chat: bool = False
-) -> str:
-    """
-    Enhanced direct AppleScript method for sending messages with SMS/RCS fallback.
-    
-    This function implements automatic fallback from iMessage to SMS/RCS when:
-    1. Recipient doesn't have iMessage
-    2. iMessage delivery fails
-    3. iMessage service is unavailable
-    
-    Args:
-        recipient: Phone number or email
-        message: Message content
-        contact_name: Optional contact name for display
-        group_chat: Whether this is a group chat
-        
-    Returns:
-        Success or error message with service type used
-    """
-    # Clean the inputs for AppleScript
-    safe_message = message.replace('"', '\\"').replace('\\', '\\\\')
-    safe_recipient = recipient.replace('"', '\\"')
-    
-    # For group chats, stick to iMessage only (SMS doesn't support group chats well)
-    if group_chat:
-        script = f'''
+_GROUP_CHAT_TEMPLATE = string.Template('''
         tell application "Messages"
             try
                 -- Try to get the existing chat
-                set targetChat to chat "{safe_recipient}"
+                set targetChat to chat "${safe_recipient}"
                 
                 -- Send the message
-                send "{safe_message}" to targetChat
+                send "${safe_message}" to targetChat
                 
                 -- Wait briefly to check for immediate errors
                 delay 1
@@ -1364,23 +2164,9 @@ def _send_message_direct(
                 return "error:" & errMsg
             end try
         end tell
-        '''
-        
-        try:
-            result = run_applescript(script)
-            if result.startswith("error:"):
-                return f"Error sending group message: {result[6:]}"
-            elif result.strip() == "success":
-                display_name = contact_name if contact_name else recipient
-                return f"Group message sent successfully to {display_name}"
-            else:
-                return f"Unknown group message result: {result}"
-        except Exception as e:
-            return f"Error sending group message: {str(e)}"
-    
-    # For individual messages, try iMessage first with automatic SMS fallback
-    # Enhanced AppleScript with built-in fallback logic
-    script = f'''
+        ''')
+
+_IMESSAGE_FALLBACK_TEMPLATE = string.Template('''
     tell application "Messages"
         try
             -- First, try iMessage
@@ -1388,10 +2174,10 @@ def _send_message_direct(
             
             try
                 -- Try to get the existing participant if possible
-                set targetBuddy to participant "{safe_recipient}" of targetService
+                set targetBuddy to participant "${safe_recipient}" of targetService
                 
                 -- Send the message via iMessage
-                send "{safe_message}" to targetBuddy
+                send "${safe_message}" to targetBuddy
                 
                 -- Wait briefly to check for immediate errors
                 delay 2
@@ -1401,11 +2187,11 @@ def _send_message_direct(
             on error iMessageErr
                 -- iMessage failed, try SMS fallback if recipient looks like a phone number
                 try
-                    -- Check if recipient looks like a phone number (contains digits)
-                    if "{safe_recipient}" contains "0" or "{safe_recipient}" contains "1" or "{safe_recipient}" contains "2" or "{safe_recipient}" contains "3" or "{safe_recipient}" contains "4" or "{safe_recipient}" contains "5" or "{safe_recipient}" contains "6" or "{safe_recipient}" contains "7" or "{safe_recipient}" contains "8" or "{safe_recipient}" contains "9" then
+                    -- Phone-number check (any digit), precomputed in Python
+                    if ${looks_like_phone} then
                         -- Try SMS service
                         set smsService to first account whose service type = SMS and enabled is true
-                        send "{safe_message}" to participant "{safe_recipient}" of smsService
+                        send "${safe_message}" to participant "${safe_recipient}" of smsService
                         
                         -- Wait briefly to check for immediate errors
                         delay 2
@@ -1424,7 +2210,131 @@ def _send_message_direct(
             return "error:" & generalErr
         end try
     end tell
-    '''
+    ''')
+
+# iMessage capability per recipient is effectively static within a session;
+# cache both positive and negative answers so repeat checks skip the
+# osascript round-trip
+_IM_AVAILABILITY: Dict[str, Tuple[bool, float]] = {}
+_IM_AVAILABILITY_TTL = 300  # seconds
+_IM_AVAILABILITY_MAX_ENTRIES = 1024
+
+def _invalidate_imessage_cache() -> None:
+    """Drop cached iMessage availability answers (e.g. on delivery oddities)."""
+    _IM_AVAILABILITY.clear()
+
+def _check_imessage_availability(recipient: str) -> bool:
+    """
+    Check if recipient has iMessage available.
+    
+    Args:
+        recipient: Phone number or email to check
+        
+    Returns:
+        True if iMessage is available, False otherwise
+    """
+    cache_key = normalize_phone_number(recipient) or recipient
+    cached = _IM_AVAILABILITY.get(cache_key)
+    if cached is not None and (time.monotonic() - cached[1]) < _IM_AVAILABILITY_TTL:
+        return cached[0]
+
+    script = _IMESSAGE_CHECK_TEMPLATE.substitute(
+        safe_recipient=recipient.translate(_APPLESCRIPT_ESCAPE)
+    )
+    
+    try:
+        available = run_applescript(script).strip().lower() == "true"
+    except:
+        return False
+    # Keep the memo bounded: drop expired entries first, then oldest ones
+    if len(_IM_AVAILABILITY) >= _IM_AVAILABILITY_MAX_ENTRIES:
+        now = time.monotonic()
+        for key in [k for k, (_, ts) in _IM_AVAILABILITY.items()
+                    if (now - ts) >= _IM_AVAILABILITY_TTL]:
+            del _IM_AVAILABILITY[key]
+        while len(_IM_AVAILABILITY) >= _IM_AVAILABILITY_MAX_ENTRIES:
+            # Dicts iterate in insertion order, so the first key is oldest
+            del _IM_AVAILABILITY[next(iter(_IM_AVAILABILITY))]
+    _IM_AVAILABILITY[cache_key] = (available, time.monotonic())
+    return available
+
+def _send_message_sms(recipient: str, message: str, contact_name: str = None) -> str:
+    """
+    Send message via SMS/RCS using AppleScript.
+    
+    Args:
+        recipient: Phone number to send to
+        message: Message content
+        contact_name: Optional contact name for display
+        
+    Returns:
+        Success or error message
+    """
+    script = _SMS_TEMPLATE.substitute(
+        safe_message=message.translate(_APPLESCRIPT_ESCAPE),
+        safe_recipient=recipient.translate(_APPLESCRIPT_ESCAPE),
+    )
+    
+    try:
+        result = run_applescript(script)
+        if result.startswith("error:"):
+            return f"Error sending SMS: {result[6:]}"
+        elif result.strip() == "success":
+            display_name = contact_name if contact_name else recipient
+            return f"SMS sent successfully to {display_name}"
+        else:
+            return f"Unknown SMS result: {result}"
+    except Exception as e:
+        return f"Error sending SMS: {str(e)}"
+
+def _send_message_direct(
+    recipient: str, message: str, contact_name: str = None, group_chat: bool = False
+) -> str:
+    """
+    Enhanced direct AppleScript method for sending messages with SMS/RCS fallback.
+    
+    This function implements automatic fallback from iMessage to SMS/RCS when:
+    1. Recipient doesn't have iMessage
+    2. iMessage delivery fails
+    3. iMessage service is unavailable
+    
+    Args:
+        recipient: Phone number or email
+        message: Message content
+        contact_name: Optional contact name for display
+        group_chat: Whether this is a group chat
+        
+    Returns:
+        Success or error message with service type used
+    """
+    # Clean the inputs for AppleScript
+    safe_message = message.translate(_APPLESCRIPT_ESCAPE)
+    safe_recipient = recipient.translate(_APPLESCRIPT_ESCAPE)
+    
+    # For group chats, stick to iMessage only (SMS doesn't support group chats well)
+    if group_chat:
+        script = _GROUP_CHAT_TEMPLATE.substitute(
+            safe_message=safe_message, safe_recipient=safe_recipient
+        )
+        
+        try:
+            result = run_applescript(script)
+            if result.startswith("error:"):
+                return f"Error sending group message: {result[6:]}"
+            elif result.strip() == "success":
+                display_name = contact_name if contact_name else recipient
+                return f"Group message sent successfully to {display_name}"
+            else:
+                return f"Unknown group message result: {result}"
+        except Exception as e:
+            return f"Error sending group message: {str(e)}"
+    
+    # For individual messages, try iMessage first with automatic SMS fallback
+    script = _IMESSAGE_FALLBACK_TEMPLATE.substitute(
+        safe_message=safe_message,
+        safe_recipient=safe_recipient,
+        looks_like_phone='true' if _HAS_DIGIT_RE.search(recipient) else 'false',
+    )
     
     try:
         result = run_applescript(script)
@@ -1443,8 +2353,28 @@ def _send_message_direct(
     except Exception as e:
         return f"Error sending message: {str(e)}"
 
+# Diagnostic reports cached for a minute: troubleshooting flows often call
+# the check tools back to back, and each one re-opened databases and re-ran
+# sqlite_master probes. Reports mentioning errors are never cached so a
+# permission fix shows up on the next call — the addressbook check joins
+# per-database probe lines, so ERROR can appear mid-report.
+_DIAG_CACHE: Dict[str, Tuple[str, float]] = {}
+_DIAG_TTL = 60  # seconds
+
+def _cached_diagnostic(key: str, producer) -> str:
+    cached = _DIAG_CACHE.get(key)
+    if cached is not None and (time.monotonic() - cached[1]) < _DIAG_TTL:
+        return cached[0]
+    report = producer()
+    if "ERROR" not in report:
+        _DIAG_CACHE[key] = (report, time.monotonic())
+    return report
+
 def check_messages_db_access() -> str:
     """Check if the Messages database is accessible and return detailed information."""
+    return _cached_diagnostic("messages_db", _check_messages_db_access_uncached)
+
+def _check_messages_db_access_uncached() -> str:
     try:
         db_path = get_messages_db_path()
         status = []
@@ -1493,6 +2423,36 @@ def check_messages_db_access() -> str:
     except Exception as e:
         return f"ERROR: Unexpected error during database access check: {str(e)} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE."
     
+# Memoized positive find_handle_by_phone results, keyed on normalized number
+_HANDLE_LOOKUP_CACHE: Dict[str, int] = {}
+
+# Handle lookup SQL hoisted per placeholder count (2 or 4 formats) so the
+# identical statement text hits sqlite3's per-connection statement cache.
+# Only ROWID is consumed; chat_count exists for the ordering, and the chat
+# table join the old query carried (for GROUP_CONCAT of display names no
+# caller read) is gone, so the IN filter resolves via handle's id index.
+_HANDLE_QUERY_BY_N = {
+    n: f"""
+    SELECT 
+        h.ROWID,
+        (SELECT COUNT(DISTINCT chj.chat_id)
+         FROM chat_handle_join chj
+         WHERE chj.handle_id = h.ROWID) as chat_count
+    FROM handle h
+    WHERE h.id IN ({', '.join('?' * n)})
+    ORDER BY 
+        -- Prioritize handles with fewer chats (likely direct messages)
+        chat_count ASC,
+        -- Then by smallest ROWID (older/more established handles)
+        h.ROWID ASC
+    """
+    for n in (2, 4)
+}
+
+def _invalidate_handle_cache() -> None:
+    """Drop memoized handle lookups, e.g. if handles look stale."""
+    _HANDLE_LOOKUP_CACHE.clear()
+
 def find_handle_by_phone(phone: str) -> Optional[int]:
     """
     Find a handle ID by phone number, trying various formats.
@@ -1508,6 +2468,23 @@ def find_handle_by_phone(phone: str) -> Optional[int]:
     normalized = normalize_phone_number(phone)
     if not normalized:
         return None
+
+    # Handles are stable within a session and the same number is resolved
+    # repeatedly from the send and filter paths; serve repeats from the memo.
+    # Only positive results are cached so a new contact's first handle is
+    # still found once it appears in the database.
+    cached = _HANDLE_LOOKUP_CACHE.get(normalized)
+    if cached is not None:
+        return cached
+
+    # Serve from the session-wide normalized index (built with the handle
+    # map, variants included) before paying for the aggregate JOIN; the
+    # query below stays as the fallback for handles newer than the index
+    _get_handle_map()
+    indexed = _NORMALIZED_HANDLE_INDEX.get(normalized)
+    if indexed is not None:
+        _HANDLE_LOOKUP_CACHE[normalized] = indexed
+        return indexed
     
     # Try various formats for US numbers
     formats_to_try = [normalized]  # Start with the normalized input
@@ -1520,32 +2497,13 @@ def find_handle_by_phone(phone: str) -> Optional[int]:
         # Try with the country code
         formats_to_try.append('1' + normalized)
     
-    # Enhanced query that helps distinguish between direct messages and group chats
-    # We'll get all matching handles with additional context
-    placeholders = ', '.join(['?' for _ in formats_to_try])
-    query = f"""
-    SELECT 
-        h.ROWID,
-        h.id,
-        COUNT(DISTINCT chj.chat_id) as chat_count,
-        MIN(chj.chat_id) as min_chat_id,
-        GROUP_CONCAT(DISTINCT c.display_name) as chat_names
-    FROM handle h
-    LEFT JOIN chat_handle_join chj ON h.ROWID = chj.handle_id
-    LEFT JOIN chat c ON chj.chat_id = c.ROWID
-    WHERE h.id IN ({placeholders}) OR h.id IN ({placeholders})
-    GROUP BY h.ROWID, h.id
-    ORDER BY 
-        -- Prioritize handles with fewer chats (likely direct messages)
-        chat_count ASC,
-        -- Then by smallest ROWID (older/more established handles)
-        h.ROWID ASC
-    """
-    
-    # Create parameters list with both the raw formats and with "+" prefix
-    params = formats_to_try + ['+' + f for f in formats_to_try]
-    
-    results = query_messages_db(query, tuple(params))
+    # One IN list over the union of raw and "+"-prefixed formats: the old
+    # "IN (...) OR IN (...)" shape bound every format twice and made the
+    # planner OR two index probes
+    all_formats = formats_to_try + ['+' + f for f in formats_to_try]
+    query = _HANDLE_QUERY_BY_N[len(all_formats)]
+
+    results = query_messages_db(query, tuple(all_formats))
     
     if not results or "error" in results[0]:
         return None
@@ -1555,10 +2513,62 @@ def find_handle_by_phone(phone: str) -> Optional[int]:
     
     # Return the first result (best match based on our ordering)
     # Our query orders by chat_count ASC (direct messages first) then ROWID ASC
-    return results[0]["ROWID"]
+    handle_rowid = results[0]["ROWID"]
+    _HANDLE_LOOKUP_CACHE[normalized] = handle_rowid
+    return handle_rowid
+
+def _probe_addressbook_db(db_path: str) -> List[str]:
+    """Probe one AddressBook source database, returning status lines."""
+    status = []
+    try:
+        with open(db_path, 'rb') as f:
+            # Just try to read a byte to confirm access
+            f.read(1)
+        status.append(f"File is readable: {db_path}")
+    except PermissionError:
+        status.append(f"ERROR: Permission denied when trying to read {db_path} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE.")
+        return status
+    except Exception as e:
+        status.append(f"ERROR: Unknown error reading file {db_path}: {str(e)} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE.")
+        return status
+
+    # Try to connect to the database (each worker owns its connection)
+    try:
+        conn = sqlite3.connect(db_path)
+        status.append(f"Successfully connected to database: {db_path}")
+
+        # Test a simple query
+        cursor = conn.cursor()
+        cursor.execute("SELECT count(*) FROM sqlite_master")
+        count = cursor.fetchone()[0]
+        status.append(f"Database contains {count} tables")
+
+        # Check if the necessary tables exist
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name IN ('ZABCDRECORD', 'ZABCDPHONENUMBER')")
+        tables = [row[0] for row in cursor.fetchall()]
+        if 'ZABCDRECORD' in tables and 'ZABCDPHONENUMBER' in tables:
+            status.append("Required tables (ZABCDRECORD, ZABCDPHONENUMBER) are present")
+        else:
+            status.append(f"WARNING: Some required tables are missing. Found: {', '.join(tables)}")
+
+        # Get a count of contacts
+        try:
+            cursor.execute("SELECT COUNT(*) FROM ZABCDRECORD")
+            contact_count = cursor.fetchone()[0]
+            status.append(f"Database contains {contact_count} contacts")
+        except sqlite3.OperationalError:
+            status.append("Could not query contact count PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE.")
+
+        conn.close()
+    except sqlite3.OperationalError as e:
+        status.append(f"ERROR: Database connection error for {db_path}: {str(e)} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE.")
+    return status
 
 def check_addressbook_access() -> str:
     """Check if the AddressBook database is accessible and return detailed information."""
+    return _cached_diagnostic("addressbook", _check_addressbook_access_uncached)
+
+def _check_addressbook_access_uncached() -> str:
     try:
         home_dir = os.path.expanduser("~")
         sources_path = os.path.join(home_dir, "Library/Application Support/AddressBook/Sources")
@@ -1571,7 +2581,7 @@ def check_addressbook_access() -> str:
         status.append(f"AddressBook Sources directory exists at: {sources_path}")
         
         # Find database files
-        db_paths = glob.glob(os.path.join(sources_path, "*/AddressBook-v22.abcddb"))
+        db_paths = _addressbook_db_paths()
         
         if not db_paths:
             return f"ERROR: No AddressBook database files found in {sources_path} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE."
@@ -1580,50 +2590,12 @@ def check_addressbook_access() -> str:
         for path in db_paths:
             status.append(f" - {path}")
         
-        # Check file permissions for each database
-        for db_path in db_paths:
-            try:
-                with open(db_path, 'rb') as f:
-                    # Just try to read a byte to confirm access
-                    f.read(1)
-                status.append(f"File is readable: {db_path}")
-            except PermissionError:
-                status.append(f"ERROR: Permission denied when trying to read {db_path} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE.")
-                continue
-            except Exception as e:
-                status.append(f"ERROR: Unknown error reading file {db_path}: {str(e)} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE.")
-                continue
-            
-            # Try to connect to the database
-            try:
-                conn = sqlite3.connect(db_path)
-                status.append(f"Successfully connected to database: {db_path}")
-                
-                # Test a simple query
-                cursor = conn.cursor()
-                cursor.execute("SELECT count(*) FROM sqlite_master")
-                count = cursor.fetchone()[0]
-                status.append(f"Database contains {count} tables")
-                
-                # Check if the necessary tables exist
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name IN ('ZABCDRECORD', 'ZABCDPHONENUMBER')")
-                tables = [row[0] for row in cursor.fetchall()]
-                if 'ZABCDRECORD' in tables and 'ZABCDPHONENUMBER' in tables:
-                    status.append("Required tables (ZABCDRECORD, ZABCDPHONENUMBER) are present")
-                else:
-                    status.append(f"WARNING: Some required tables are missing. Found: {', '.join(tables)}")
-                
-                # Get a count of contacts
-                try:
-                    cursor.execute("SELECT COUNT(*) FROM ZABCDRECORD")
-                    contact_count = cursor.fetchone()[0]
-                    status.append(f"Database contains {contact_count} contacts")
-                except sqlite3.OperationalError:
-                    status.append("Could not query contact count PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE.")
-                
-                conn.close()
-            except sqlite3.OperationalError as e:
-                status.append(f"ERROR: Database connection error for {db_path}: {str(e)} PLEASE TELL THE USER TO GRANT FULL DISK ACCESS TO THE TERMINAL APPLICATION(CURSOR, TERMINAL, CLAUDE, ETC.) AND RESTART THE APPLICATION. DO NOT RETRY UNTIL NEXT MESSAGE.")
+        # Probe the databases in parallel: with several sources (iCloud,
+        # local, Exchange) the check takes max(probe) instead of sum(probe).
+        # ex.map preserves input order so the report stays deterministic.
+        with ThreadPoolExecutor(max_workers=min(4, len(db_paths))) as ex:
+            for probe_lines in ex.map(_probe_addressbook_db, db_paths):
+                status.extend(probe_lines)
         
         # Try to get actual contacts
         contacts = get_addressbook_contacts()
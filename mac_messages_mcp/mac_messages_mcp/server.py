@@ -10,14 +10,15 @@ import sys
 from mcp.server.fastmcp import Context, FastMCP
 
 from mac_messages_mcp.messages import (
+    _CONFIDENCE_EMOJI,
     _check_imessage_availability,
     check_addressbook_access,
     check_messages_db_access,
     find_contact_by_name,
     fuzzy_search_messages,
     get_cached_contacts,
+    get_named_group_chats,
     get_recent_messages,
-    query_messages_db,
     send_message,
 )
 
@@ -30,6 +31,21 @@ logging.basicConfig(
 
 logger = logging.getLogger("mac_messages_mcp")
 
+# Match-type labels for tool_find_contact, hoisted so the per-match loop
+# doesn't rebuild dict literals (confidence emoji are shared with messages)
+_MATCH_TYPE_DESC = {
+    'exact': 'exact match',
+    'partial': 'partial match',
+    'initials': 'initials match',
+    'fuzzy': 'fuzzy match'
+}
+_MATCH_TYPE_TAG = {
+    'exact': ' (exact)',
+    'partial': ' (partial)',
+    'initials': ' (initials)',
+    'fuzzy': ' (fuzzy)'
+}
+
 # Initialize the MCP server
 mcp = FastMCP("MessageBridge")
 
@@ -101,19 +117,8 @@ def tool_find_contact(ctx: Context, name: str) -> str:
         
         if len(matches) == 1:
             contact = matches[0]
-            confidence_emoji = {
-                'very_high': '🟢',
-                'high': '🟡', 
-                'medium': '🟠',
-                'low': '🔴'
-            }.get(contact.get('confidence', 'unknown'), '⚪')
-            
-            match_type_desc = {
-                'exact': 'exact match',
-                'partial': 'partial match',
-                'initials': 'initials match',
-                'fuzzy': 'fuzzy match'
-            }.get(contact.get('match_type', 'fuzzy'), 'match')
+            confidence_emoji = _CONFIDENCE_EMOJI.get(contact.get('confidence', 'unknown'), '⚪')
+            match_type_desc = _MATCH_TYPE_DESC.get(contact.get('match_type', 'fuzzy'), 'match')
             
             return f"{confidence_emoji} Found: {contact['name']} ({contact['phone']}) - {match_type_desc}, {contact['score']:.1%} confidence"
         else:
@@ -121,23 +126,12 @@ def tool_find_contact(ctx: Context, name: str) -> str:
             result = [f"Found {len(matches)} contacts matching '{name}':"]
             
             for i, contact in enumerate(matches[:15]):  # Show more results
-                confidence_emoji = {
-                    'very_high': '🟢',
-                    'high': '🟡', 
-                    'medium': '🟠',
-                    'low': '🔴'
-                }.get(contact.get('confidence', 'unknown'), '⚪')
-                
-                match_type_info = {
-                    'exact': ' (exact)',
-                    'partial': ' (partial)',
-                    'initials': ' (initials)', 
-                    'fuzzy': ' (fuzzy)'
-                }.get(contact.get('match_type', 'fuzzy'), '')
-                
-                score_display = f" [{contact['score']:.1%}]"
-                line = f"{i+1}. {confidence_emoji} {contact['name']} ({contact['phone']}){match_type_info}{score_display}"
-                result.append(line)
+                confidence_emoji = _CONFIDENCE_EMOJI.get(contact.get('confidence', 'unknown'), '⚪')
+                match_type_info = _MATCH_TYPE_TAG.get(contact.get('match_type', 'fuzzy'), '')
+                result.append(
+                    f"{i+1}. {confidence_emoji} {contact['name']} ({contact['phone']})"
+                    f"{match_type_info} [{contact['score']:.1%}]"
+                )
             
             if len(matches) > 15:
                 result.append(f"...and {len(matches) - 15} more matches.")
@@ -207,8 +201,7 @@ def tool_get_chats(ctx: Context) -> str:
     """
     logger.info("Getting available chats")
     try:
-        query = "SELECT chat_identifier, display_name FROM chat WHERE display_name IS NOT NULL"
-        results = query_messages_db(query)
+        results = get_named_group_chats()
         
         if not results:
             return "No group chats found."
@@ -15,8 +15,10 @@ import subprocess
 import sys
 from pathlib import Path
 
-# Define version pattern
+# Define version pattern, compiled once for the two files we rewrite
 VERSION_PATTERN = r'\d+\.\d+\.\d+'
+_PYPROJECT_VERSION_RE = re.compile(r'version = "(' + VERSION_PATTERN + ')"')
+_INIT_VERSION_RE = re.compile(r'__version__ = "(' + VERSION_PATTERN + ')"')
 
 def print_help():
     """Print help information"""
@@ -31,7 +33,7 @@ def get_current_version():
         sys.exit(1)
     
     content = pyproject_path.read_text()
-    version_match = re.search(r'version = "(' + VERSION_PATTERN + ')"', content)
+    version_match = _PYPROJECT_VERSION_RE.search(content)
     if not version_match:
         print("Error: Could not find version in pyproject.toml!")
         sys.exit(1)
@@ -63,21 +65,13 @@ def update_files(new_version):
     # Update pyproject.toml
     pyproject_path = Path("pyproject.toml")
     content = pyproject_path.read_text()
-    updated_content = re.sub(
-        r'version = "' + VERSION_PATTERN + '"',
-        f'version = "{new_version}"',
-        content
-    )
+    updated_content = _PYPROJECT_VERSION_RE.sub(f'version = "{new_version}"', content)
     pyproject_path.write_text(updated_content)
     
     # Update __init__.py
     init_path = Path("mac_messages_mcp/__init__.py")
     content = init_path.read_text()
-    updated_content = re.sub(
-        r'__version__ = "' + VERSION_PATTERN + '"',
-        f'__version__ = "{new_version}"',
-        content
-    )
+    updated_content = _INIT_VERSION_RE.sub(f'__version__ = "{new_version}"', content)
     init_path.write_text(updated_content)
     
     print(f"Updated version to {new_version} in pyproject.toml and __init__.py")
@@ -22,13 +22,13 @@ def test_import_fixes():
     """Test that the critical import fixes work"""
     print("Testing import fixes...")
     
-    # Test that thefuzz import works
+    # Test that rapidfuzz import works
     try:
-        from thefuzz import fuzz
-        print("✅ thefuzz import works")
+        from rapidfuzz import fuzz
+        print("✅ rapidfuzz import works")
         return True
     except ImportError as e:
-        print(f"❌ thefuzz import failed: {e}")
+        print(f"❌ rapidfuzz import failed: {e}")
         return False
 
 
@@ -5,11 +5,13 @@ Provides web search, scraping, and automation capabilities with enterprise secur
 """
 
 import asyncio
+import re
 import subprocess
 import json
 import logging
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+from urllib.parse import urlsplit
 import sys
 import os
 
@@ -68,6 +70,17 @@ class SecureBrowserMCP:
         self.playwright_process = None
         self.playwright_port = 3001
         self.server_config = self._load_config()
+        # Compile the blocklist into one alternation pattern so each URL is
+        # scanned once in C instead of once per blocked origin
+        blocked_origins = self.server_config["blocked_origins"]
+        self._blocked_origins_re = (
+            re.compile("|".join(re.escape(origin) for origin in blocked_origins))
+            if blocked_origins else None
+        )
+        # Hostname-level blocklist: O(1) per lookup and immune to the
+        # substring pitfalls (a blocked 'doubleclick.net' shouldn't match
+        # 'gooddoubleclick.net', but should match its subdomains)
+        self._blocked_hosts = frozenset(origin.lower() for origin in blocked_origins)
         
     def _load_config(self) -> Dict[str, Any]:
         """Load browser server configuration."""
@@ -127,9 +140,10 @@ class SecureBrowserMCP:
                 cwd="."
             )
             
-            # Give it time to start
-            await asyncio.sleep(3)
-            
+            # Wait until the port accepts connections instead of sleeping a
+            # fixed 3 seconds; a fast startup proceeds in a few hundred ms
+            await self._wait_for_server_ready(self.playwright_port)
+
             # Check if process is still running
             if self.playwright_process.poll() is not None:
                 stdout, stderr = self.playwright_process.communicate()
@@ -142,6 +156,24 @@ class SecureBrowserMCP:
             logger.error(f"Failed to start Playwright server: {e}")
             raise
     
+    async def _wait_for_server_ready(self, port: int, timeout: float = 10.0):
+        """Poll the server port until it accepts connections or timeout passes."""
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            # Stop early if the subprocess already died; the caller surfaces
+            # the startup error from its poll() check
+            if self.playwright_process and self.playwright_process.poll() is not None:
+                return
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.close()
+                await writer.wait_closed()
+                return
+            except OSError:
+                await asyncio.sleep(0.05)
+        logger.warning(f"Playwright server port {port} not ready after {timeout}s")
+
     async def stop_playwright_server(self):
         """Stop the Playwright MCP server."""
         if self.playwright_process:
@@ -302,10 +334,23 @@ class SecureBrowserMCP:
         if not url.startswith(('http://', 'https://')):
             return False
         
-        # Check against blocked origins
-        for blocked_origin in self.server_config["blocked_origins"]:
-            if blocked_origin in url:
-                return False
+        # Check the parsed hostname (and its parent domains) against the
+        # blocklist: exact frozenset probes, so a blocked origin also covers
+        # its subdomains without matching unrelated look-alike hosts
+        hostname = urlsplit(url).hostname
+        if hostname:
+            host = hostname.lower()
+            while host:
+                if host in self._blocked_hosts:
+                    return False
+                if '.' not in host:
+                    break
+                host = host.split('.', 1)[1]
+
+        # Conservative fallback: the single-pass substring scan still catches
+        # blocked origins embedded elsewhere in the URL
+        if self._blocked_origins_re and self._blocked_origins_re.search(url):
+            return False
         
         # Additional security checks could go here
         return True
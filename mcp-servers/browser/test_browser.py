@@ -5,6 +5,7 @@ Tests basic browser automation functionality with security features.
 """
 
 import asyncio
+import io
 import json
 import logging
 import sys
@@ -20,79 +21,108 @@ from server import SecureBrowserMCP
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# Output is buffered per test phase and written in one stdout syscall, so the
+# async test flow isn't blocked on the pipe for every print.
+_print_buffer = io.StringIO()
+
+def _emit(line: str = "") -> None:
+    _print_buffer.write(line + "\n")
+
+def _flush_output() -> None:
+    sys.stdout.write(_print_buffer.getvalue())
+    sys.stdout.flush()
+    _print_buffer.seek(0)
+    _print_buffer.truncate(0)
+
 async def test_browser_server():
     """Test the secure browser MCP server."""
     
-    print("🔍 Testing Playwright MCP Browser Server")
-    print("=" * 50)
-    
+    _emit("🔍 Testing Playwright MCP Browser Server")
+    _emit("=" * 50)
+
     browser_server = SecureBrowserMCP()
-    
+
     try:
         # Test 1: Server Status
-        print("\n1. Testing server status...")
+        _emit("\n1. Testing server status...")
         status = await browser_server.get_server_status()
-        print(f"✅ Server Status: {json.dumps(status, indent=2)}")
-        
+        _emit(f"✅ Server Status: {_dumps(status)}")
+
         # Test 2: Start Playwright Server
-        print("\n2. Starting Playwright MCP server...")
+        _emit("\n2. Starting Playwright MCP server...")
         await browser_server.start_playwright_server()
-        print("✅ Playwright server started successfully")
-        
-        # Wait a moment for server to be ready
-        await asyncio.sleep(2)
-        
+        _emit("✅ Playwright server started successfully")
+
+        # Poll for readiness instead of a fixed 2s sleep; moves on as soon
+        # as the server reports running.
+        deadline = asyncio.get_event_loop().time() + 2.0
+        while asyncio.get_event_loop().time() < deadline:
+            status = await browser_server.get_server_status()
+            if status.get("status") == "running":
+                break
+            await asyncio.sleep(0.1)
+
         # Test 3: Updated Status
-        print("\n3. Checking updated server status...")
+        _emit("\n3. Checking updated server status...")
         status = await browser_server.get_server_status()
-        print(f"✅ Updated Status: {json.dumps(status, indent=2)}")
-        
+        _emit(f"✅ Updated Status: {_dumps(status)}")
+
         # Test 4: Mock Search (with fallback security)
-        print("\n4. Testing web search functionality...")
+        _emit("\n4. Testing web search functionality...")
         search_result = await browser_server.search_web(
             query="Python programming tutorials",
             max_results=3,
             user_id="test_user"
         )
-        print(f"✅ Search Result: {json.dumps(search_result, indent=2)}")
-        
+        _emit(f"✅ Search Result: {_dumps(search_result)}")
+
         # Test 5: URL Safety Check
-        print("\n5. Testing URL safety checks...")
+        _emit("\n5. Testing URL safety checks...")
         safe_url = "https://www.python.org"
         unsafe_url = "https://malware.com/evil"
-        
-        print(f"Safe URL ({safe_url}): {browser_server._is_safe_url(safe_url)}")
-        print(f"Unsafe URL ({unsafe_url}): {browser_server._is_safe_url(unsafe_url)}")
-        
+
+        _emit(f"Safe URL ({safe_url}): {browser_server._is_safe_url(safe_url)}")
+        _emit(f"Unsafe URL ({unsafe_url}): {browser_server._is_safe_url(unsafe_url)}")
+
         # Test 6: Mock Navigation
-        print("\n6. Testing navigation functionality...")
+        _emit("\n6. Testing navigation functionality...")
         nav_result = await browser_server.navigate_to_url(
             url="https://www.python.org",
             user_id="test_user"
         )
-        print(f"✅ Navigation Result: {json.dumps(nav_result, indent=2)}")
-        
+        _emit(f"✅ Navigation Result: {_dumps(nav_result)}")
+
         # Test 7: Mock Interaction
-        print("\n7. Testing page interaction...")
+        _emit("\n7. Testing page interaction...")
         interaction_result = await browser_server.interact_with_page(
             action="click",
             target="button#search",
             value="",
             user_id="test_user"
         )
-        print(f"✅ Interaction Result: {json.dumps(interaction_result, indent=2)}")
-        
-        print("\n🎉 All browser tests completed successfully!")
-        
+        _emit(f"✅ Interaction Result: {_dumps(interaction_result)}")
+
+        _emit("\n🎉 All browser tests completed successfully!")
+
     except Exception as e:
         logger.error(f"❌ Test failed: {e}")
-        print(f"\n❌ Test failed: {e}")
-        
+        _emit(f"\n❌ Test failed: {e}")
+
     finally:
         # Clean shutdown
-        print("\n8. Stopping Playwright server...")
+        _emit("\n8. Stopping Playwright server...")
         await browser_server.stop_playwright_server()
-        print("✅ Server stopped cleanly")
+        _emit("✅ Server stopped cleanly")
+        _flush_output()
 
 async def test_input_validation():
     """Test input validation for browser operations."""
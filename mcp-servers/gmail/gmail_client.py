@@ -1,13 +1,35 @@
 """Gmail client wrapper for the MCP server."""
 
+import asyncio
+import base64
+import logging
 import sys
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-# Add the services/orchestrator path to Python path so we can import existing services
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../services/orchestrator'))
+# Add the services/orchestrator path to Python path so we can import existing
+# services. Computed absolutely and added only once so repeated imports don't
+# grow sys.path with duplicate entries the finders then re-scan.
+_ORCHESTRATOR_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'services', 'orchestrator')
+)
+if _ORCHESTRATOR_DIR not in sys.path:
+    sys.path.insert(0, _ORCHESTRATOR_DIR)
 
 from app.services.gmail_service import GmailService, GmailTokenStore
+from googleapiclient.discovery import build
+import google_auth_httplib2
+import httplib2
+
+# The only headers list_messages surfaces. The API is asked for exactly these
+# via metadataHeaders, but filter defensively rather than trusting that.
+_WANTED_HEADERS = frozenset(("From", "To", "Subject", "Date"))
+
+# Upper bound on the body text returned by get_message, so a multi-MB HTML
+# email doesn't get shipped wholesale over the MCP text transport.
+_MAX_BODY_CHARS = 1_000_000
+
+logger = logging.getLogger(__name__)
 
 
 class GmailClient:
@@ -15,7 +37,58 @@ class GmailClient:
     
     def __init__(self):
         self.gmail_service = GmailService()
-    
+        # Built service objects memoized per account: build() parses the
+        # discovery document and constructs every resource method, which is
+        # pure CPU overhead when repeated on each tool call.
+        self._service_cache: Dict[str, Tuple[Any, Any]] = {}
+        # The cached service's httplib2 transport is not thread-safe, and
+        # executes run in worker threads; this lock serializes requests on
+        # the shared transport per account.
+        self._transport_locks: Dict[str, asyncio.Lock] = {}
+        # Strong references to in-flight background tasks: the event loop
+        # only keeps weak refs, so a pending task could otherwise be GC'd.
+        self._bg_tasks: set = set()
+
+    async def _get_service(self, account: str) -> Tuple[Any, Any]:
+        """Return a (service, creds) pair, reusing the built service per account.
+
+        The cached service is invalidated whenever the access token changes
+        (e.g. after a refresh) so requests never go out with stale credentials.
+        """
+        creds = await self.gmail_service._build_creds(account)
+        cached = self._service_cache.get(account)
+        if cached is not None and cached[1].token == creds.token:
+            return cached[0], creds
+
+        # A persistent transport keeps the TCP+TLS connection alive across
+        # calls (httplib2 pools connections per host), so the handshake is
+        # paid once per account instead of per request.
+        authed_http = google_auth_httplib2.AuthorizedHttp(
+            creds, http=httplib2.Http(timeout=20)
+        )
+        service = await asyncio.to_thread(
+            build, "gmail", "v1", http=authed_http, cache_discovery=False
+        )
+        self._service_cache[account] = (service, creds)
+        return service, creds
+
+    def _transport_lock(self, account: str) -> asyncio.Lock:
+        """Lock guarding the cached per-account transport."""
+        return self._transport_locks.setdefault(account, asyncio.Lock())
+
+    def _persist_tokens_in_background(self, account: str, creds: Any) -> None:
+        """Schedule token persistence without holding up the tool response."""
+        task = asyncio.create_task(
+            self.gmail_service._maybe_persist_refreshed(account, creds)
+        )
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_persist_done)
+
+    def _on_persist_done(self, task) -> None:
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background token persistence failed: %s", task.exception())
+
     async def send_email(self, account: str, to: List[str], subject: str, body_markdown: str) -> Dict[str, Any]:
         """Send an email via Gmail."""
         return await self.gmail_service.send_email(account, to, subject, body_markdown)
@@ -26,33 +99,35 @@ class GmailClient:
     
     async def list_messages(self, account: str, query: str = "", max_results: int = 10) -> Dict[str, Any]:
         """List recent Gmail messages."""
-        # Build credentials
-        creds = await self.gmail_service._build_creds(account)
-        
+        service, creds = await self._get_service(account)
+        transport_lock = self._transport_lock(account)
+
         try:
-            from googleapiclient.discovery import build
-            service = build("gmail", "v1", credentials=creds, cache_discovery=False)
-            
             # List messages
-            results = service.users().messages().list(
+            list_request = service.users().messages().list(
                 userId="me",
                 q=query,
                 maxResults=max_results
-            ).execute()
+            )
+            async with transport_lock:
+                results = await asyncio.to_thread(list_request.execute)
             
             messages = results.get("messages", [])
             
-            # Get basic info for each message
+            # Get basic info for each message. The metadata fetches go out as a
+            # single batched HTTP request instead of one round trip per message;
+            # callbacks fire in the order requests were added, so message_list
+            # keeps the API's ordering.
             message_list = []
-            for msg in messages:
-                msg_detail = service.users().messages().get(
-                    userId="me",
-                    id=msg["id"],
-                    format="metadata",
-                    metadataHeaders=["From", "To", "Subject", "Date"]
-                ).execute()
-                
-                headers = {h["name"]: h["value"] for h in msg_detail.get("payload", {}).get("headers", [])}
+
+            def _collect_metadata(request_id, msg_detail, exception):
+                if exception is not None:
+                    raise exception
+                headers = {}
+                for h in msg_detail.get("payload", {}).get("headers", []):
+                    name = h["name"]
+                    if name in _WANTED_HEADERS:
+                        headers[name] = h["value"]
                 message_list.append({
                     "id": msg_detail["id"],
                     "threadId": msg_detail["threadId"],
@@ -62,9 +137,48 @@ class GmailClient:
                     "date": headers.get("Date", ""),
                     "snippet": msg_detail.get("snippet", "")
                 })
+
+            if messages:
+                try:
+                    batch = service.new_batch_http_request(callback=_collect_metadata)
+                    for msg in messages:
+                        batch.add(service.users().messages().get(
+                            userId="me",
+                            id=msg["id"],
+                            format="metadata",
+                            metadataHeaders=["From", "To", "Subject", "Date"]
+                        ))
+                    async with transport_lock:
+                        await asyncio.to_thread(batch.execute)
+                except Exception:
+                    # Some proxies mangle multipart batch responses. Fall back
+                    # to per-message gets, capped at 8 in flight so we still
+                    # overlap the round trips instead of serializing them.
+                    message_list.clear()
+                    sem = asyncio.Semaphore(8)
+
+                    async def _fetch_metadata(msg):
+                        async with sem:
+                            # httplib2 connections aren't thread-safe, so each
+                            # concurrent fetch gets its own transport rather
+                            # than sharing the service's pooled one.
+                            http = google_auth_httplib2.AuthorizedHttp(
+                                creds, http=httplib2.Http(timeout=20)
+                            )
+                            req = service.users().messages().get(
+                                userId="me",
+                                id=msg["id"],
+                                format="metadata",
+                                metadataHeaders=["From", "To", "Subject", "Date"]
+                            )
+                            return await asyncio.to_thread(req.execute, http=http)
+
+                    details = await asyncio.gather(*(_fetch_metadata(m) for m in messages))
+                    for msg_detail in details:
+                        _collect_metadata(None, msg_detail, None)
             
-            # Persist latest tokens
-            await self.gmail_service._maybe_persist_refreshed(account, creds)
+            # Persist latest tokens off the critical path
+            self._persist_tokens_in_background(account, creds)
             
             return {
                 "messages": message_list,
@@ -76,19 +190,17 @@ class GmailClient:
     
     async def get_message(self, account: str, message_id: str) -> Dict[str, Any]:
         """Get details of a specific Gmail message."""
-        # Build credentials
-        creds = await self.gmail_service._build_creds(account)
-        
+        service, creds = await self._get_service(account)
+
         try:
-            from googleapiclient.discovery import build
-            service = build("gmail", "v1", credentials=creds, cache_discovery=False)
-            
             # Get message details
-            message = service.users().messages().get(
+            get_request = service.users().messages().get(
                 userId="me",
                 id=message_id,
                 format="full"
-            ).execute()
+            )
+            async with self._transport_lock(account):
+                message = await asyncio.to_thread(get_request.execute)
             
             # Extract headers
             headers = {h["name"]: h["value"] for h in message.get("payload", {}).get("headers", [])}
@@ -96,8 +208,8 @@ class GmailClient:
             # Extract body
             body = self._extract_message_body(message.get("payload", {}))
             
-            # Persist latest tokens
-            await self.gmail_service._maybe_persist_refreshed(account, creds)
+            # Persist latest tokens off the critical path
+            self._persist_tokens_in_background(account, creds)
             
             return {
                 "id": message["id"],
@@ -114,20 +226,29 @@ class GmailClient:
             raise RuntimeError(f"Failed to get message: {str(e)}") from e
     
     def _extract_message_body(self, payload: Dict[str, Any]) -> str:
-        """Extract the body text from a Gmail message payload."""
-        body = ""
-        
-        if "body" in payload and payload["body"].get("data"):
-            import base64
-            body_data = payload["body"]["data"]
-            body = base64.urlsafe_b64decode(body_data).decode("utf-8", errors="ignore")
-        
-        elif "parts" in payload:
-            for part in payload["parts"]:
-                if part.get("mimeType") == "text/plain" and part.get("body", {}).get("data"):
-                    import base64
-                    body_data = part["body"]["data"]
-                    body = base64.urlsafe_b64decode(body_data).decode("utf-8", errors="ignore")
-                    break
-        
-        return body
\ No newline at end of file
+        """Extract the body text from a Gmail message payload.
+
+        Single-part messages return their own body. Multipart messages are
+        walked with an explicit stack so text/plain is found even when
+        multipart/alternative is nested inside multipart/mixed, and the walk
+        short-circuits at the first match.
+        """
+        if payload.get("body", {}).get("data"):
+            # Decode to bytes first and drop the encoded copy before building
+            # the str, so at most one large transient lives at a time.
+            decoded = base64.urlsafe_b64decode(payload["body"]["data"])
+            return decoded.decode("utf-8", errors="ignore")[:_MAX_BODY_CHARS]
+
+        # Depth-first in document order: children pushed reversed so the
+        # first part comes off the stack first.
+        stack = list(reversed(payload.get("parts", [])))
+        while stack:
+            part = stack.pop()
+            if part.get("mimeType", "").startswith("text/plain") and part.get("body", {}).get("data"):
+                decoded = base64.urlsafe_b64decode(part["body"]["data"])
+                return decoded.decode("utf-8", errors="ignore")[:_MAX_BODY_CHARS]
+            child_parts = part.get("parts")
+            if child_parts:
+                stack.extend(reversed(child_parts))
+
+        return ""
\ No newline at end of file
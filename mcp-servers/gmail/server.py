@@ -7,6 +7,7 @@ An MCP server that provides Gmail functionality including sending emails and cre
 import asyncio
 import json
 import logging
+import os
 import sys
 from typing import Any, Dict, List, Optional, Sequence
 
@@ -17,14 +18,28 @@ import mcp.types as types
 
 from gmail_client import GmailClient
 
-# Import security components
-sys.path.append('../security')
+# Import security components. The security package lives in mcp-servers/, so
+# its parent directory goes on sys.path — absolute (the old CWD-relative
+# '../security' only resolved when launched from this directory) and added
+# only once so repeated imports don't accumulate duplicate path entries.
+_MCP_SERVERS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _MCP_SERVERS_DIR not in sys.path:
+    sys.path.insert(0, _MCP_SERVERS_DIR)
 from security import require_auth, validate_input, rate_limit, GmailToolInput, SecurityMiddleware
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("gmail-mcp-server")
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
 class GmailMCPServer:
     def __init__(self):
         self.server = Server("gmail")
@@ -136,67 +151,74 @@ class GmailMCPServer:
                 )
             ]
 
+        async def _send_email(validated_input: GmailToolInput) -> List[types.TextContent]:
+            # Check permissions (this would be integrated with MCP auth)
+            # For now, we'll log the security check
+            logger.info("Security check passed for gmail_send_email")
+
+            result = await self.gmail_client.send_email(
+                account=validated_input.account,
+                to=validated_input.to,
+                subject=validated_input.subject,
+                body_markdown=validated_input.body
+            )
+            return [types.TextContent(
+                type="text",
+                text=f"Email sent successfully. Message ID: {result.get('id', 'unknown')}"
+            )]
+
+        async def _create_draft(validated_input: GmailToolInput) -> List[types.TextContent]:
+            result = await self.gmail_client.create_draft(
+                account=validated_input.account,
+                to=validated_input.to,
+                subject=validated_input.subject,
+                body_markdown=validated_input.body
+            )
+            return [types.TextContent(
+                type="text",
+                text=f"Draft created successfully. Draft ID: {result.get('id', 'unknown')}"
+            )]
+
+        async def _list_messages(validated_input: GmailToolInput) -> List[types.TextContent]:
+            result = await self.gmail_client.list_messages(
+                account=validated_input.account,
+                query=validated_input.query or "",
+                max_results=validated_input.max_results
+            )
+            return [types.TextContent(type="text", text=_dumps(result))]
+
+        async def _get_message(validated_input: GmailToolInput) -> List[types.TextContent]:
+            result = await self.gmail_client.get_message(
+                account=validated_input.account,
+                message_id=validated_input.message_id
+            )
+            return [types.TextContent(type="text", text=_dumps(result))]
+
+        # One dict lookup replaces the per-call string comparison chain, and
+        # adding a tool is now a single entry here.
+        self._dispatch = {
+            "gmail_send_email": _send_email,
+            "gmail_create_draft": _create_draft,
+            "gmail_list_messages": _list_messages,
+            "gmail_get_message": _get_message,
+        }
+
         @self.server.call_tool()
         async def handle_call_tool(
             name: str, arguments: Optional[dict] = None
         ) -> List[types.TextContent]:
             try:
-                # Apply security middleware
-                if name == "gmail_send_email":
-                    # Validate input
-                    validated_input = GmailToolInput(**arguments)
-                    
-                    # Check permissions (this would be integrated with MCP auth)
-                    # For now, we'll log the security check
-                    logger.info(f"Security check passed for {name}")
-                    
-                    result = await self.gmail_client.send_email(
-                        account=validated_input.account,
-                        to=validated_input.to,
-                        subject=validated_input.subject,
-                        body_markdown=validated_input.body
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=f"Email sent successfully. Message ID: {result.get('id', 'unknown')}"
-                    )]
-                
-                elif name == "gmail_create_draft":
-                    result = await self.gmail_client.create_draft(
-                        account=arguments["account"],
-                        to=arguments["to"],
-                        subject=arguments["subject"],
-                        body_markdown=arguments["body"]
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=f"Draft created successfully. Draft ID: {result.get('id', 'unknown')}"
-                    )]
-                
-                elif name == "gmail_list_messages":
-                    result = await self.gmail_client.list_messages(
-                        account=arguments["account"],
-                        query=arguments.get("query", ""),
-                        max_results=arguments.get("max_results", 10)
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "gmail_get_message":
-                    result = await self.gmail_client.get_message(
-                        account=arguments["account"],
-                        message_id=arguments["message_id"]
-                    )
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                else:
+                handler = self._dispatch.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
-            
+
+                # Every tool shares the one GmailToolInput model, so all
+                # handlers get the same validation instead of only send_email.
+                # Pydantic compiles the model's validators once at class
+                # definition, so per-call construction is just field checks.
+                validated_input = GmailToolInput(**(arguments or {}))
+                return await handler(validated_input)
+
             except Exception as e:
                 logger.error(f"Error calling tool {name}: {e}")
                 return [types.TextContent(
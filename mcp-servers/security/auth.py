@@ -4,10 +4,13 @@ Implements industry-standard security practices including JWT tokens,
 role-based access control, and secure session management.
 """
 
+import atexit
 import os
 import jwt
 import hashlib
+import queue
 import secrets
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Set, Tuple
@@ -218,45 +221,85 @@ class AuditLogger:
     def _setup_audit_logger(self):
         """Set up audit logging."""
         os.makedirs(os.path.dirname(self.config.AUDIT_LOG_PATH), exist_ok=True)
-        
+
         self.audit_logger = logging.getLogger('audit')
         self.audit_logger.setLevel(logging.INFO)
-        
+
         handler = logging.FileHandler(self.config.AUDIT_LOG_PATH)
         formatter = logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s'
         )
         handler.setFormatter(formatter)
         self.audit_logger.addHandler(handler)
-    
+
+        # Events are queued and written by a background thread in batches,
+        # so tool calls never block on audit-log I/O
+        self._event_queue = queue.SimpleQueue()
+        self._flush_thread = threading.Thread(
+            target=self._flush_events, name='audit-log-flush', daemon=True
+        )
+        self._flush_thread.start()
+        atexit.register(self._drain_pending)
+
+    def _enqueue(self, level: int, message: str):
+        """Queue an audit record for the background flush thread."""
+        self._event_queue.put((level, message))
+
+    def _flush_events(self):
+        """Drain queued audit records in batches (up to 64 or 100ms apart)."""
+        while True:
+            batch = [self._event_queue.get()]
+            deadline = time.monotonic() + 0.1
+            while len(batch) < 64:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._event_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            for level, message in batch:
+                self.audit_logger.log(level, message)
+
+    def _drain_pending(self):
+        """Write any still-queued records synchronously at shutdown."""
+        try:
+            while True:
+                level, message = self._event_queue.get_nowait()
+                self.audit_logger.log(level, message)
+        except queue.Empty:
+            pass
+
     def log_authentication(self, user_id: str, success: bool, ip_address: str = None):
         """Log authentication attempts."""
         if not self.config.AUDIT_LOG_ENABLED:
             return
-            
+
         status = "SUCCESS" if success else "FAILED"
-        self.audit_logger.info(
+        self._enqueue(
+            logging.INFO,
             f"AUTH - {status} - User: {user_id} - IP: {ip_address or 'unknown'}"
         )
-    
-    def log_api_call(self, user_id: str, tool_name: str, success: bool, 
+
+    def log_api_call(self, user_id: str, tool_name: str, success: bool,
                      ip_address: str = None, error_msg: str = None):
         """Log API calls."""
         if not self.config.AUDIT_LOG_ENABLED:
             return
-            
-        status = "SUCCESS" if success else "FAILED" 
+
+        status = "SUCCESS" if success else "FAILED"
         error_info = f" - Error: {error_msg}" if error_msg else ""
-        self.audit_logger.info(
+        self._enqueue(
+            logging.INFO,
             f"API - {status} - User: {user_id} - Tool: {tool_name} - IP: {ip_address or 'unknown'}{error_info}"
         )
-    
+
     def log_security_event(self, event_type: str, details: str, severity: str = "INFO"):
         """Log security events."""
         if not self.config.AUDIT_LOG_ENABLED:
             return
-            
-        self.audit_logger.log(
+
+        self._enqueue(
             getattr(logging, severity.upper(), logging.INFO),
             f"SECURITY - {event_type} - {details}"
         )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 import re as _re
@@ -251,6 +252,40 @@ def _run_helper(payload: Dict[str, Any]) -> Dict[str, Any]:
     return data
 
 
+def _send_to_each(recipients: List[str], body: str) -> List[Dict[str, Any]]:
+    """Send body to each recipient as an individual helper call.
+
+    Each call spawns the Swift helper and waits on AppleScript, so the sends
+    are overlapped across a small thread pool instead of running back to
+    back; results keep recipient order. Memory inserts happen after the
+    parallel phase so SQLiteMemory is only touched from the request thread.
+    """
+    def _send_one(handle: str) -> Dict[str, Any]:
+        try:
+            return _run_helper({"action": "send", "to": [handle], "body": body})
+        except HTTPException as e:
+            return {"status": "error", "detail": e.detail}
+
+    if len(recipients) == 1:
+        results = [_send_one(recipients[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(recipients))) as executor:
+            results = list(executor.map(_send_one, recipients))
+
+    for handle, result in zip(recipients, results):
+        if result.get("status") != "error":
+            try:
+                _ = _memory.insert(
+                    kind="im_handle",
+                    text=handle,
+                    meta={"channel": "imessage"},
+                    vector=None,
+                )
+            except Exception:
+                pass
+    return results
+
+
 def _sanitize_query(q: str) -> str:
     # Remove most non-word characters (keeps letters/numbers/space/@.+- for emails/handles), collapse spaces
     s = _re.sub(r"[^A-Za-z0-9 @.+\-]", "", q)
@@ -337,21 +372,7 @@ def send(payload: SendPayload) -> Dict[str, Any]:
                     parts = cand.get("participants") or []
                     if parts:
                         # Split multi-recipient into N single-recipient sends to avoid -1728 on some macOS builds
-                        results: List[Dict[str, Any]] = []
-                        for p in parts:
-                            try:
-                                results.append(_run_helper({"action": "send", "to": [p], "body": payload.body}))
-                                try:
-                                    _ = _memory.insert(
-                                        kind="im_handle",
-                                        text=p,
-                                        meta={"channel": "imessage"},
-                                        vector=None,
-                                    )
-                                except Exception:
-                                    pass
-                            except HTTPException as ie:
-                                results.append({"status": "error", "detail": ie.detail})
+                        results = _send_to_each([str(p) for p in parts], payload.body)
                         return {"status": "ok", "results": results}
             raise
 
@@ -360,22 +381,7 @@ def send(payload: SendPayload) -> Dict[str, Any]:
             raise HTTPException(status_code=400, detail="Missing recipients")
         # If more than one recipient, split into single sends to avoid group AppleScript issues
         if len(payload.to) > 1:
-            results: List[Dict[str, Any]] = []
-            for p in payload.to:
-                try:
-                    res = _run_helper({"action": "send", "to": [p], "body": payload.body})
-                    results.append(res)
-                    try:
-                        _ = _memory.insert(
-                            kind="im_handle",
-                            text=p,
-                            meta={"channel": "imessage"},
-                            vector=None,
-                        )
-                    except Exception:
-                        pass
-                except HTTPException as e:
-                    results.append({"status": "error", "detail": e.detail})
+            results = _send_to_each(payload.to, payload.body)
             # If every attempt failed, surface error instead of silent OK
             success_count = sum(1 for r in results if isinstance(r, dict) and r.get("status") == "sent")
             if success_count == 0: